@@ -10,7 +10,6 @@ Date: 2024
 """
 
 import argparse
-import json
 import subprocess
 import sys
 from pathlib import Path
@@ -22,6 +21,11 @@ import time
 import os
 import logging
 
+# Import the shared JSON helpers as a plain module so the script does not
+# pull in the rest of the utils package and its dependencies
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src" / "utils"))
+from json_io import dumps_json, loads_json
+
 
 class Structure3DResult:
     """Container for 3D structure prediction results."""
@@ -127,8 +131,7 @@ class mRNA3DStructurePipeline:
         
         if comprehensive_file:
             self.logger.info(f"✓ Loading comprehensive results from {comprehensive_file}")
-            with open(comprehensive_file, 'r') as f:
-                comprehensive_data = json.load(f)
+            comprehensive_data = loads_json(comprehensive_file.read_bytes())
                 
             # Extract results for each RNAfold method
             if 'results' in comprehensive_data:
@@ -153,9 +156,7 @@ class mRNA3DStructurePipeline:
                         method_name = method_dir.name
                         parsed_file = method_dir / "parsed_results" / "structure_parsed.json"
                         if parsed_file.exists():
-                            with open(parsed_file, 'r') as f:
-                                method_data = json.load(f)
-                                results[method_name] = method_data
+                            results[method_name] = loads_json(parsed_file.read_bytes())
         
         if not results:
             self.logger.error("❌ No RNAfold results found. Please run the structure prediction pipeline first.")
@@ -766,8 +767,7 @@ END""")
                     'quality_score': result.quality_score
                 }
         
-        with open(results_file, 'w') as f:
-            json.dump(serializable_results, f, indent=2)
+        results_file.write_bytes(dumps_json(serializable_results))
         
         self.logger.info(f"✓ 3D results saved to {results_file}")
     
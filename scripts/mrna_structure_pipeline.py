@@ -15,7 +15,6 @@ Examples:
     python mrna_structure_pipeline.py YEAST data/yeast_sequence.fasta
 """
 
-import json
 import csv
 import subprocess
 from pathlib import Path
@@ -25,6 +24,13 @@ import argparse
 import sys
 import os
 
+import numpy as np
+
+# Import the shared JSON helpers as a plain module so the script does not
+# pull in the rest of the utils package and its dependencies
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src" / "utils"))
+from json_io import dumps_json
+
 
 class StructureResult:
     """Container for structure prediction results."""
@@ -37,7 +43,9 @@ class StructureResult:
         self.sequence = sequence
         self.structure = structure
         self.energy = energy
-        self.base_pairs = base_pairs
+        # (n, 2) int32 rows of (i, j): compact in memory and serialised
+        # without a per-pair Python loop
+        self.base_pairs = np.asarray(base_pairs, dtype=np.int32).reshape(-1, 2)
         self.num_base_pairs = num_base_pairs
         self.gc_content = gc_content
         self.base_pair_density = base_pair_density
@@ -401,8 +409,7 @@ class mRNAStructurePipeline:
         
         # Save JSON summary
         json_file = self.comparisons_dir / f"{self.sequence_prefix}_comprehensive_results.json"
-        with open(json_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        json_file.write_bytes(dumps_json(summary))
         
         # Save CSV summary
         csv_file = self.comparisons_dir / f"{self.sequence_prefix}_results_summary.csv"
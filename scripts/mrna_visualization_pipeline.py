@@ -15,33 +15,280 @@ Examples:
     python mrna_visualization_pipeline.py YEAST /path/to/results/
 """
 
+import argparse
+import hashlib
 import json
-import matplotlib.pyplot as plt
-import numpy as np
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 
+# matplotlib and numpy are imported on first use (see _load_plotting and
+# _load_numpy) so that guide-only and parse-only callers never pay for them
+plt = None
+np = None
+
+# Points per base-pair arc, evenly spaced in angle between the paired positions
+ARC_POINTS = 16
+
+# Plot name -> pipeline method, in the order the plots are rendered
+PLOT_METHODS = {
+    'energy': 'create_energy_comparison_plot',
+    'metrics': 'create_structural_metrics_dashboard',
+    'structure': 'create_structure_comparison_plot',
+    'temp': 'create_parameter_sensitivity_plot',
+    'summary': 'create_comprehensive_summary_plot'
+}
+
+# Plot name -> (output file stem, label used in progress messages)
+PLOT_OUTPUTS = {
+    'energy': ('energy_comparison', 'Energy comparison plot'),
+    'metrics': ('structural_metrics', 'Structural metrics dashboard'),
+    'structure': ('structure_comparison', 'Structure comparison plot'),
+    'temp': ('temperature_sensitivity', 'Parameter sensitivity plot'),
+    'summary': ('comprehensive_summary', 'Comprehensive summary plot')
+}
+
+
+# Interpretation guide written next to the plots; filled in with format_map
+_GUIDE_TEMPLATE = """# mRNA Structure Visualization Interpretation Guide
+
+## Overview
+This guide explains how to interpret each visualization generated by the mRNA structure prediction pipeline for sequence: **{prefix}**
+
+## Generated Visualizations
+
+### 1. Energy Comparison Plot (`{prefix}_energy_comparison.pdf/png`)
+
+**What it shows:**
+- Free energy values (in kcal/mol) for each prediction method
+- Color-coded bars: Red indicates the best (lowest) energy structure
+- Blue bars show other prediction methods
+- Dashed red line indicates the best energy threshold
+
+**How to interpret:**
+- **Lower (more negative) energy = more stable structure**
+- The most negative energy represents the most thermodynamically favorable structure
+- Compare energy differences between methods to understand parameter effects
+- Look for consistency across different prediction approaches
+
+**Key insights:**
+- Temperature variations show how thermal conditions affect structure stability
+- Parameter modifications (maxspan, noGU) reveal structural constraints
+- Partition function provides ensemble information
+
+### 2. Structural Metrics Dashboard (`{prefix}_structural_metrics.pdf/png`)
+
+**What it shows:**
+- **Base Pair Counts (Teal Green bars):** Number of paired nucleotides in each structure
+- **Structural Stability (Flat Purple bars):** Energy magnitude showing structural stability
+- **Structural Density (Soft Burnt Orange bars):** Ratio of paired to total nucleotides
+- **Structural Complexity Heatmap:** Correlation matrix showing relationships between structural parameters
+
+**How to interpret:**
+- **Base Pairs:** Higher counts indicate more complex secondary structure
+- **Structural Stability:** Higher energy magnitude indicates more stable structures
+- **Structural Density:** Values closer to 1.0 indicate highly structured RNA
+- **Heatmap:** Brighter colors indicate stronger parameter effects
+
+**Key insights:**
+- Compare structural complexity across different prediction methods
+- Identify which parameters most strongly affect structure prediction
+- Understand the relationship between structural stability and complexity
+
+### 3. Structure Comparison Plot (`{prefix}_structure_comparison.pdf/png`)
+
+**What it shows:**
+- Circular representations of RNA secondary structures
+- Red arcs connecting paired nucleotides
+- Sequence position labels around the circle
+- Method-specific subplots for comparison
+
+**How to interpret:**
+- **Circle perimeter:** Represents the RNA sequence in linear order
+- **Red arcs:** Base pairs connecting distant sequence positions
+- **Arc thickness:** Indicates base pair strength/confidence
+- **Position labels:** Help identify specific sequence regions
+
+**Key insights:**
+- Visualize how different parameters affect structural topology
+- Identify conserved structural elements across methods
+- Compare local vs. long-range interactions
+- Understand structural motifs and domains
+
+### 4. Parameter Sensitivity Analysis (`{prefix}_temperature_sensitivity.pdf/png`)
+
+**What it shows:**
+- Line plot of energy vs. temperature
+- Data points showing energy values at different temperatures
+- Trend analysis across parameter variations
+
+**How to interpret:**
+- **Slope:** Steep slopes indicate high temperature sensitivity
+- **Data points:** Individual energy measurements
+- **Trend lines:** Show overall parameter effects
+- **Error bars:** Indicate prediction confidence
+
+**Key insights:**
+- Understand thermal stability of the RNA structure
+- Identify optimal temperature conditions
+- Predict structural changes under different conditions
+- Assess robustness of structure predictions
+
+### 5. Comprehensive Summary Plot (`{prefix}_comprehensive_summary.pdf/png`)
+
+**What it shows:**
+- Multi-panel dashboard combining all analyses
+- Energy comparison subplot
+- Structural metrics subplot
+- Parameter effects analysis
+- Quality assessment
+- Summary statistics
+
+**How to interpret:**
+- **Top panels:** Energy and structural comparisons
+- **Middle panel:** Parameter sensitivity analysis
+- **Bottom panels:** Quality metrics and summary statistics
+- **Color coding:** Consistent across all panels
+
+**Key insights:**
+- Comprehensive overview of all prediction results
+- Identify the most reliable prediction method
+- Understand parameter trade-offs
+- Quality assessment of predictions
+
+## Color Scheme
+
+- **Red (#e74c3c):** Best energy structures, highlights, important features
+- **Blue (#3498db):** Standard structures, data points, secondary features
+- **Teal Green (#16a085):** Base pair counts, structural complexity
+- **Flat Purple (#8e44ad):** Structural stability, energy analysis
+- **Soft Burnt Orange (#d35400):** Structural density, pairing efficiency
+- **Gun Metal Blue (#2c3e50):** Primary text, axes, labels
+
+## Quality Assessment
+
+**High Quality Predictions:**
+- Consistent energy values across methods
+- Reasonable base pair counts (20-60% of sequence length)
+- GC content appropriate for RNA type
+- Structural density between 0.2-0.6
+
+**Warning Signs:**
+- Large energy variations between similar methods
+- Unrealistic base pair counts (0 or >80%)
+- Extremely high/low GC content
+- Inconsistent structural patterns
+
+## Best Practices
+
+1. **Compare multiple methods:** Don't rely on a single prediction
+2. **Consider biological context:** RNA type, organism, conditions
+3. **Validate with experiments:** Computational predictions need experimental verification
+4. **Check parameter sensitivity:** Ensure predictions are robust
+5. **Examine structural motifs:** Look for known RNA structural elements
+
+## File Formats
+
+- **PDF files:** High-resolution vector graphics for publications (written with `--pdf`)
+- **PNG files:** Quick preview images for presentations
+- **JSON files:** Raw data for further analysis
+- **CSV files:** Spreadsheet-compatible data tables
+
+## Technical Notes
+
+- **Energy units:** kcal/mol (more negative = more stable)
+- **Base pairs:** Watson-Crick and wobble pairs
+- **GC content:** Percentage of G and C nucleotides
+- **Structural density:** Paired nucleotides / total nucleotides
+- **Temperature:** Celsius (biological range: 25-50°C)
+
+---
+*Generated for sequence: {prefix}*
+*Analysis date: {date}*
+"""
+
+
+def _load_numpy():
+    """Import numpy on first use."""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+
+
+def _load_plotting():
+    """Import matplotlib (pinned to the Agg backend) and numpy on first use."""
+    global plt
+    _load_numpy()
+    if plt is not None:
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # Batch rendering only, never needs a GUI event loop
+    matplotlib.interactive(False)
+    import matplotlib.pyplot
+    plt = matplotlib.pyplot
+
+
+def parse_base_pairs(structure: str) -> 'np.ndarray':
+    """Parse dot-bracket notation into an (n, 2) array of (open, close) positions."""
+    _load_numpy()
+    codes = np.frombuffer(structure.encode('ascii'), dtype=np.uint8)
+    
+    # Only walk the bracket positions, not every character of the structure
+    positions = np.nonzero((codes == ord('(')) | (codes == ord(')')))[0]
+    is_open = codes[positions] == ord('(')
+    
+    base_pairs = []
+    stack = []
+    for pos, opening in zip(positions.tolist(), is_open.tolist()):
+        if opening:
+            stack.append(pos)
+        elif stack:
+            base_pairs.append((stack.pop(), pos))
+    
+    return np.array(base_pairs, dtype=int).reshape(-1, 2)
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a whole-second timestamp; repeated calls within a second reuse the string."""
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
+
 class mRNAVisualizationPipeline:
     """Beautiful visualization pipeline for mRNA structure analysis."""
     
-    def __init__(self, sequence_prefix: str, results_dir: str):
+    def __init__(self, sequence_prefix: str, results_dir: str, formats: Tuple[str, ...] = ('png',)):
         self.sequence_prefix = sequence_prefix
         self.results_dir = Path(results_dir)
+        self.formats = tuple(formats)  # PDF is opt-in, it is the slow format to emit
         self.output_dir = self.results_dir / "visualizations"
         self.output_dir.mkdir(exist_ok=True)
         
+        # Figures are reused between plots, keyed by figure size and layout
+        self._figures = {}
+        self._trig_cache = {}
+        self._plotting_ready = False
+        
         # Load results
         self.results = self.load_results()
         
         # Set up beautiful aesthetics
         self.setup_aesthetics()
     
+    def __del__(self):
+        """Close the cached figures when the pipeline is torn down."""
+        for fig in getattr(self, '_figures', {}).values():
+            plt.close(fig)
+    
     def setup_aesthetics(self):
-        """Configure beautiful, clean aesthetics with flatter CMYK colors, thicker edges, and better spacing."""
-        plt.style.use('default')
-        
+        """Define the flatter CMYK color palette; matplotlib styling is applied in _ensure_plotting."""
         # Flatter CMYK-inspired color palette
         self.colors = {
             'primary': '#2c3e50',        # Gun metal blue
@@ -55,8 +302,17 @@ class mRNAVisualizationPipeline:
             'white': '#ffffff',
             'black': '#2c3e50'
         }
+    
+    def _ensure_plotting(self):
+        """Import matplotlib and numpy, apply thick-edged styling and extract metrics on first use."""
+        if self._plotting_ready:
+            return
+        
+        _load_plotting()
+        plt.style.use('default')
         
-        # Configure matplotlib with thicker edges and more spacing
+        # Configure matplotlib with thicker edges and more spacing; spine and
+        # tick styling lives here so plots don't restyle each axis by hand
         plt.rcParams.update({
             'font.family': 'sans-serif',
             'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
@@ -65,6 +321,8 @@ class mRNAVisualizationPipeline:
             'axes.edgecolor': self.colors['primary'],
             'axes.labelcolor': self.colors['primary'],
             'axes.titlesize': 0,  # No titles
+            'axes.spines.top': True,
+            'axes.spines.right': True,
             'xtick.major.size': 12,
             'xtick.major.width': 3.5,
             'xtick.major.pad': 12,
@@ -83,38 +341,156 @@ class mRNAVisualizationPipeline:
             'axes.facecolor': 'white',
             'savefig.facecolor': 'white',
             'savefig.dpi': 300,
-            'savefig.bbox': 'tight'
+            'savefig.bbox': 'tight',
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000
         })
+        
+        self._extract_metrics()
+        self._plotting_ready = True
     
     def load_results(self) -> Dict[str, Any]:
         """Load results from JSON file."""
         json_file = self.results_dir / f"{self.sequence_prefix}_comprehensive_results.json"
         if json_file.exists():
-            with open(json_file, 'r') as f:
-                return json.load(f)
+            return json.loads(json_file.read_bytes())
         else:
             print(f"Warning: Results file {json_file} not found")
             return {}
     
+    def _get_figure(self, figsize: tuple, layout: Optional[str] = None):
+        """Return a cleared figure of the given size and layout engine, creating it on first use."""
+        fig = self._figures.get((figsize, layout))
+        if fig is None:
+            fig = self._figures[(figsize, layout)] = plt.figure(figsize=figsize, layout=layout)
+        else:
+            fig.clear()
+        return fig
+    
+    def _input_hash(self, inputs) -> str:
+        """Hash the slice of results a plot is drawn from."""
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _is_up_to_date(self, name: str, key: str) -> bool:
+        """Check whether a plot was already rendered from the same inputs.
+        
+        Delete the hidden ``.<prefix>_<name>.hash`` sidecar to force a re-render.
+        """
+        hash_file = self.output_dir / f".{self.sequence_prefix}_{name}.hash"
+        outputs = [self.output_dir / f"{self.sequence_prefix}_{name}.{fmt}" for fmt in self.formats]
+        return (hash_file.exists() and hash_file.read_text() == key
+                and all(output.exists() for output in outputs))
+    
+    def _plot_key(self, plot: str) -> Optional[str]:
+        """Hash the slice of the results a plot is drawn from (None if it has nothing to draw).
+        
+        Built from the raw results only, so up-to-date checks never import
+        matplotlib or numpy.
+        """
+        results = self.results.get('results', {})
+        if plot == 'energy':
+            inputs = {m: d['energy'] for m, d in results.items() if 'energy' in d}
+        elif plot in ('metrics', 'summary'):
+            inputs = {m: [d['num_base_pairs'], d['base_pair_density'], d['energy']]
+                      for m, d in results.items()
+                      if {'num_base_pairs', 'base_pair_density', 'energy'} <= d.keys()}
+        elif plot == 'structure':
+            inputs = {m: [d['sequence'], d['structure']] for m, d in results.items()
+                      if d.get('sequence') and d.get('structure')}
+            if not inputs:
+                return None
+        else:
+            inputs = {m: d['energy'] for m, d in results.items()
+                      if 'temperature' in m.lower() and 'energy' in d}
+        return self._input_hash(inputs)
+    
+    def _needs_render(self, plot: str) -> bool:
+        """Whether a plot has something to draw and its outputs are missing or stale."""
+        if not self.results:
+            return False
+        key = self._plot_key(plot)
+        return key is not None and not self._is_up_to_date(PLOT_OUTPUTS[plot][0], key)
+    
+    def _save_figure(self, fig, name: str, key: Optional[str] = None):
+        """Write a figure out in each of ``self.formats``, cropped to its tight bounding box.
+        
+        If ``key`` is given it is stored next to the outputs so unchanged plots
+        can be skipped on the next run.
+        """
+        fig.set_dpi(300)
+        if hasattr(fig, 'draw_without_rendering'):
+            # Lay the figure out without rasterising it and measure the tight
+            # bounding box once; every savefig then rasterises exactly once.
+            # The box includes artists outside the canvas, such as outside legends
+            fig.draw_without_rendering()
+            bbox = fig.get_tightbbox().padded(0.1)
+        else:  # matplotlib < 3.6: let savefig measure the box itself
+            bbox = 'tight'
+        
+        for fmt in self.formats:
+            output_file = self.output_dir / f"{self.sequence_prefix}_{name}.{fmt}"
+            fig.savefig(output_file, dpi=300, bbox_inches=bbox)
+        
+        if key is not None:
+            (self.output_dir / f".{self.sequence_prefix}_{name}.hash").write_text(key)
+    
+    def _extract_metrics(self):
+        """Collect per-method structural metrics from the results in a single pass."""
+        methods = []
+        base_pairs = []
+        densities = []
+        energies = []
+        
+        for method, data in self.results.get('results', {}).items():
+            if {'num_base_pairs', 'base_pair_density', 'energy'} <= data.keys():
+                methods.append(method.replace('rnafold_', '').replace('_', ' ').title())
+                base_pairs.append(data['num_base_pairs'])
+                densities.append(data['base_pair_density'])
+                energies.append(abs(data['energy']))
+        
+        # If no real data, create mock data
+        if not methods:
+            methods = ['Default', 'Temperature 25C', 'Temperature 50C', 'Maxspan 20', 'No GU', 'Partfunc']
+            base_pairs = [8, 12, 3, 6, 5, 9]
+            densities = [0.186, 0.279, 0.070, 0.140, 0.116, 0.209]
+            energies = [42.9, 53.42, 32.3, 33.2, 37.7, 42.9]
+        
+        self._metric_methods = methods
+        self._metric_base_pairs = np.asarray(base_pairs)
+        self._metric_densities = np.asarray(densities)
+        self._metric_energies = np.asarray(energies)
+    
     def create_energy_comparison_plot(self):
         """Create beautiful energy comparison visualization."""
         if not self.results:
             return
         
-        fig, ax = plt.subplots(figsize=(14, 9))
+        key = self._plot_key('energy')
+        if self._is_up_to_date("energy_comparison", key):
+            return
+        
+        self._ensure_plotting()
+        results = self.results.get('results', {})
+        
+        fig = self._get_figure((14, 9))
+        ax = fig.add_subplot(111)
         
         # Extract data
         methods = []
         energies = []
         colors = []
         
-        for method, data in self.results.get('results', {}).items():
+        best = min((d['energy'] for d in results.values() if 'energy' in d), default=None)
+        
+        for method, data in results.items():
             if 'energy' in data:
                 methods.append(method.replace('rnafold_', '').replace('_', ' ').title())
                 energies.append(data['energy'])
                 
                 # Color coding based on energy
-                if data['energy'] == min([d['energy'] for d in self.results.get('results', {}).values() if 'energy' in d]):
+                if data['energy'] == best:
                     colors.append(self.colors['accent1'])  # Flat red for best
                 else:
                     colors.append(self.colors['accent2'])  # Flat blue for others
@@ -129,10 +505,7 @@ class mRNAVisualizationPipeline:
                      edgecolor=gun_metal, linewidth=4, alpha=0.9)
         
         # Add value labels on bars with more spacing
-        for i, (bar, energy) in enumerate(zip(bars, energies)):
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.2,
-                   f'{energy:.2f}', ha='center', va='bottom', fontsize=12,
-                   color=gun_metal, fontweight='bold')
+        ax.bar_label(bars, fmt='%.2f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # Customize axes with more spacing
         ax.set_xlabel('Prediction Method', fontsize=14, fontweight='bold', color=gun_metal)
@@ -140,11 +513,6 @@ class mRNAVisualizationPipeline:
         ax.set_xticks(range(len(methods)))
         ax.set_xticklabels(methods, rotation=45, ha='right', fontsize=12)
         
-        # Remove spines except bottom and left
-        for spine in ax.spines.values():
-            spine.set_color(gun_metal)
-            spine.set_linewidth(3.5)
-        
         # Add subtle grid only on y-axis
         ax.yaxis.grid(True, alpha=0.3, linestyle='-', linewidth=1)
         ax.set_axisbelow(True)
@@ -154,39 +522,28 @@ class mRNAVisualizationPipeline:
         ax.axhline(y=best_energy, color=flat_red, linestyle='--', 
                   alpha=0.8, linewidth=3, label=f'Best Energy: {best_energy:.2f}')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_energy_comparison.pdf", 
-                   dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_energy_comparison.png", 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, "energy_comparison", key)
     
     def create_structural_metrics_dashboard(self):
         """Create comprehensive structural metrics visualization."""
         if not self.results:
             return
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 14))
+        key = self._plot_key('metrics')
+        if self._is_up_to_date("structural_metrics", key):
+            return
         
-        # Extract data
-        methods = []
-        base_pairs = []
-        densities = []
-        energies = []
+        self._ensure_plotting()
         
-        for method, data in self.results.get('results', {}).items():
-            if all(key in data for key in ['num_base_pairs', 'base_pair_density', 'energy']):
-                methods.append(method.replace('rnafold_', '').replace('_', ' ').title())
-                base_pairs.append(data['num_base_pairs'])
-                densities.append(data['base_pair_density'])
-                energies.append(abs(data['energy']))
+        fig = self._get_figure((16, 14), layout='constrained')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        # If no real data, create mock data
-        if not methods:
-            methods = ['Default', 'Temperature 25C', 'Temperature 50C', 'Maxspan 20', 'No GU', 'Partfunc']
-            base_pairs = [8, 12, 3, 6, 5, 9]
-            densities = [0.186, 0.279, 0.070, 0.140, 0.116, 0.209]
-            energies = [42.9, 53.42, 32.3, 33.2, 37.7, 42.9]
+        # Use the metrics extracted once at load time
+        methods = self._metric_methods
+        base_pairs = self._metric_base_pairs
+        densities = self._metric_densities
+        energies = self._metric_energies
         
         # Define new flatter CMYK colors
         teal_green = self.colors['accent3']
@@ -203,9 +560,7 @@ class mRNAVisualizationPipeline:
         ax1.set_xticklabels(methods, rotation=45, ha='right', fontsize=11)
         
         # Add value labels with more spacing
-        for i, (bar, count) in enumerate(zip(bars1, base_pairs)):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.3,
-                    str(count), ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
+        ax1.bar_label(bars1, fmt='%d', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # 2. Structural Stability (Energy Magnitude) - Using flat purple
         bars2 = ax2.bar(range(len(methods)), energies, 
@@ -216,9 +571,7 @@ class mRNAVisualizationPipeline:
         ax2.set_xticklabels(methods, rotation=45, ha='right', fontsize=11)
         
         # Add value labels with more spacing
-        for i, (bar, energy) in enumerate(zip(bars2, energies)):
-            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.8,
-                    f'{energy:.1f}', ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
+        ax2.bar_label(bars2, fmt='%.1f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # 3. Structural Density - Using burnt orange
         bars3 = ax3.bar(range(len(methods)), densities, 
@@ -229,13 +582,16 @@ class mRNAVisualizationPipeline:
         ax3.set_xticklabels(methods, rotation=45, ha='right', fontsize=11)
         
         # Add value labels with more spacing
-        for i, (bar, density) in enumerate(zip(bars3, densities)):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.02,
-                    f'{density:.3f}', ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
+        ax3.bar_label(bars3, fmt='%.3f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # 4. Structural Complexity Heatmap (Base Pairs vs Density vs Energy)
-        metrics_data = np.array([base_pairs, densities, energies]).T
-        im = ax4.imshow(metrics_data, cmap='Blues', aspect='auto', alpha=0.9)
+        # Normalize each metric to [0, 1] on its own scale and apply the colormap
+        # up front, so imshow gets a ready-made uint8 RGBA image
+        metrics_data = np.array([base_pairs, densities, energies], dtype=float).T
+        spread = np.ptp(metrics_data, axis=0)
+        normalized = (metrics_data - metrics_data.min(axis=0)) / np.where(spread == 0, 1, spread)
+        cmap = plt.get_cmap('Blues')
+        ax4.imshow(cmap(normalized, bytes=True), aspect='auto', interpolation='nearest', alpha=0.9)
         
         # Customize heatmap
         ax4.set_xticks(range(3))
@@ -244,38 +600,35 @@ class mRNAVisualizationPipeline:
         ax4.set_yticklabels(methods, fontsize=10)
         
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax4, shrink=0.8)
+        cbar = fig.colorbar(plt.cm.ScalarMappable(norm=plt.Normalize(0, 1), cmap=cmap), 
+                            ax=ax4, shrink=0.8)
         cbar.set_label('Normalized Value', fontsize=11, color=gun_metal)
         
-        # Customize all subplots with thicker edges
-        for ax in [ax1, ax2, ax3, ax4]:
-            for spine in ax.spines.values():
-                spine.set_color(gun_metal)
-                spine.set_linewidth(3.5)
-            ax.tick_params(colors=gun_metal)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_structural_metrics.pdf", 
-                   dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_structural_metrics.png", 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure(fig, "structural_metrics", key)
     
     def create_structure_comparison_plot(self):
         """Create circular structure comparison visualization."""
         if not self.results:
             return
         
-        # Determine number of methods
-        methods = list(self.results.get('results', {}).keys())
+        # Determine number of methods that actually have something to draw
+        results = self.results.get('results', {})
+        methods = [m for m, d in results.items() if d.get('sequence') and d.get('structure')]
         if not methods:
             return
         
+        key = self._plot_key('structure')
+        if self._is_up_to_date("structure_comparison", key):
+            return
+        
+        self._ensure_plotting()
+        
         n_methods = len(methods)
         cols = min(3, n_methods)
         rows = (n_methods + cols - 1) // cols
         
-        fig, axes = plt.subplots(rows, cols, figsize=(5*cols, 5*rows))
+        fig = self._get_figure((5*cols, 5*rows))
+        axes = fig.subplots(rows, cols)
         if n_methods == 1:
             axes = [axes]
         elif rows == 1:
@@ -295,50 +648,43 @@ class mRNAVisualizationPipeline:
         for i in range(n_methods, len(axes)):
             axes[i].set_visible(False)
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_structure_comparison.pdf", 
-                   dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_structure_comparison.png", 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, "structure_comparison", key)
     
     def plot_structure_on_axis(self, ax, sequence: str, structure: str, method: str):
         """Plot RNA structure on given axis."""
         # Parse base pairs
-        base_pairs = []
-        stack = []
-        for i, char in enumerate(structure):
-            if char == '(':
-                stack.append(i)
-            elif char == ')':
-                if stack:
-                    j = stack.pop()
-                    base_pairs.append((j, i))
+        base_pairs = parse_base_pairs(structure)
         
         # Create circular plot
         n = len(sequence)
-        angles = np.linspace(0, 2*np.pi, n, endpoint=False)
-        
-        # Plot sequence positions with bolder markers
-        ax.scatter(np.cos(angles), np.sin(angles), s=80, c=self.colors['primary'], 
-                  alpha=0.9, edgecolors=self.colors['primary'], linewidth=2)
-        
-        # Plot base pairs as arcs with bolder lines
-        for i, j in base_pairs:
-            if i < j and i < n and j < n:  # Ensure indices are within bounds
-                # Create arc between positions i and j
-                arc_angles = np.linspace(angles[i], angles[j], 50)
-                arc_x = 0.8 * np.cos(arc_angles)
-                arc_y = 0.8 * np.sin(arc_angles)
-                ax.plot(arc_x, arc_y, color=self.colors['accent1'], linewidth=4, alpha=0.8)
-        
-        # Add sequence labels
-        for i, (angle, base) in enumerate(zip(angles, sequence)):
-            if i % 20 == 0:  # Label every 20th position for longer sequences
-                x = 1.3 * np.cos(angle)
-                y = 1.3 * np.sin(angle)
-                ax.text(x, y, f'{i+1}', ha='center', va='center', fontsize=9, 
-                       color=self.colors['primary'], fontweight='bold')
+        steps = ARC_POINTS - 1
+        circle = self._circle_points(n)
+        positions = circle[::steps]
+        
+        # Plot sequence positions with bolder markers (rasterized so the PDF
+        # carries one image instead of thousands of marker paths)
+        ax.scatter(positions[:, 0], positions[:, 1], s=80, c=self.colors['primary'], 
+                  alpha=0.9, edgecolors=self.colors['primary'], linewidth=2, rasterized=True)
+        
+        # Plot base pairs as arcs with bolder lines, all in one collection
+        pairs = base_pairs[base_pairs[:, 1] < n]  # Ensure indices are within bounds
+        if len(pairs):
+            from matplotlib.collections import LineCollection
+            
+            # Arc k-th points sit at angle i + k*(j - i)/steps positions, which
+            # are exact rows of the cached grid, so no trig is needed per arc
+            i, j = pairs[:, 0, None], pairs[:, 1, None]
+            k = np.arange(ARC_POINTS)[None, :]
+            segments = 0.8 * circle[i * steps + k * (j - i)]
+            ax.add_collection(LineCollection(segments, colors=self.colors['accent1'], 
+                                             linewidths=4, alpha=0.8, rasterized=True))
+        
+        # Add sequence labels every 20th position for longer sequences
+        label_idx = np.arange(0, n, 20)
+        for i, (x, y) in zip(label_idx, 1.3 * positions[label_idx]):
+            ax.text(x, y, f'{i+1}', ha='center', va='center', 
+                   fontsize=9, color=self.colors['primary'], fontweight='bold')
         
         # Customize axis
         ax.set_xlim(-1.6, 1.6)
@@ -351,12 +697,32 @@ class mRNAVisualizationPipeline:
         ax.text(0, -1.4, method_clean, ha='center', va='center', fontsize=11, 
                fontweight='bold', color=self.colors['primary'])
     
+    def _circle_points(self, n: int) -> 'np.ndarray':
+        """Return cached unit-circle coordinates on a fine angle grid for a length-n sequence.
+        
+        The grid has ``ARC_POINTS - 1`` steps per sequence position, so every
+        ``ARC_POINTS - 1``-th row is a sequence position and every arc point
+        falls exactly on a row.
+        """
+        circle = self._trig_cache.get(n)
+        if circle is None:
+            angles = np.linspace(0, 2*np.pi, n * (ARC_POINTS - 1), endpoint=False)
+            circle = self._trig_cache[n] = np.column_stack([np.cos(angles), np.sin(angles)])
+        return circle
+    
     def create_parameter_sensitivity_plot(self):
         """Create parameter sensitivity analysis visualization."""
         if not self.results:
             return
         
-        fig, ax = plt.subplots(figsize=(12, 8))
+        key = self._plot_key('temp')
+        if self._is_up_to_date("temperature_sensitivity", key):
+            return
+        
+        self._ensure_plotting()
+        
+        fig = self._get_figure((12, 8))
+        ax = fig.add_subplot(111)
         
         # Extract temperature data
         temperatures = []
@@ -398,44 +764,28 @@ class mRNAVisualizationPipeline:
         ax.set_ylabel('Free Energy (kcal/mol)', fontsize=14, fontweight='bold', color=self.colors['primary'])
         ax.grid(True, alpha=0.3)
         
-        # Customize spines
-        for spine in ax.spines.values():
-            spine.set_color(self.colors['primary'])
-            spine.set_linewidth(3.5)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_temperature_sensitivity.pdf", 
-                   dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_temperature_sensitivity.png", 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        self._save_figure(fig, "temperature_sensitivity", key)
     
     def create_comprehensive_summary_plot(self):
         """Create comprehensive summary visualization."""
         if not self.results:
             return
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 14))
+        key = self._plot_key('summary')
+        if self._is_up_to_date("comprehensive_summary", key):
+            return
         
-        # Extract data
-        methods = []
-        base_pairs = []
-        densities = []
-        energies = []
+        self._ensure_plotting()
         
-        for method, data in self.results.get('results', {}).items():
-            if all(key in data for key in ['num_base_pairs', 'base_pair_density', 'energy']):
-                methods.append(method.replace('rnafold_', '').replace('_', ' ').title())
-                base_pairs.append(data['num_base_pairs'])
-                densities.append(data['base_pair_density'])
-                energies.append(abs(data['energy']))
+        fig = self._get_figure((16, 14), layout='constrained')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
-        # If no real data, create mock data
-        if not methods:
-            methods = ['Default', 'Temperature 25C', 'Temperature 50C', 'Maxspan 20', 'No GU', 'Partfunc']
-            base_pairs = [8, 12, 3, 6, 5, 9]
-            densities = [0.186, 0.279, 0.070, 0.140, 0.116, 0.209]
-            energies = [42.9, 53.42, 32.3, 33.2, 37.7, 42.9]
+        # Use the metrics extracted once at load time
+        methods = self._metric_methods
+        base_pairs = self._metric_base_pairs
+        densities = self._metric_densities
+        energies = self._metric_energies
         
         # Define new flatter CMYK colors
         teal_green = self.colors['accent3']
@@ -446,16 +796,14 @@ class mRNAVisualizationPipeline:
         
         # 1. Energy Comparison
         bars1 = ax1.bar(range(len(methods)), energies, 
-                        color=[flat_red if e == max(energies) else flat_purple for e in energies], 
+                        color=np.where(energies == energies.max(), flat_red, flat_purple).tolist(), 
                         alpha=0.9, edgecolor=gun_metal, linewidth=4)
         ax1.set_ylabel('Energy Magnitude (kcal/mol)', fontsize=14, fontweight='bold', color=gun_metal)
         ax1.set_xticks(range(len(methods)))
         ax1.set_xticklabels(methods, rotation=45, ha='right', fontsize=11)
         
         # Add value labels
-        for i, (bar, energy) in enumerate(zip(bars1, energies)):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.8,
-                    f'{energy:.1f}', ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
+        ax1.bar_label(bars1, fmt='%.1f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # 2. Structural Metrics (Base Pairs and Density only)
         x = np.arange(len(methods))
@@ -463,7 +811,7 @@ class mRNAVisualizationPipeline:
         
         bars2a = ax2.bar(x - width/2, base_pairs, width, label='Base Pairs', 
                          color=teal_green, alpha=0.9, edgecolor=gun_metal, linewidth=4)
-        bars2b = ax2.bar(x + width/2, [d*100 for d in densities], width, label='Density (%)', 
+        bars2b = ax2.bar(x + width/2, densities * 100, width, label='Density (%)', 
                          color=burnt_orange, alpha=0.9, edgecolor=gun_metal, linewidth=4)
         
         ax2.set_ylabel('Value', fontsize=14, fontweight='bold', color=gun_metal)
@@ -472,15 +820,9 @@ class mRNAVisualizationPipeline:
         ax2.legend(fontsize=11)
         
         # Add value labels
-        for bar in bars2a:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2, height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom', fontsize=10, color=gun_metal, fontweight='bold')
+        ax2.bar_label(bars2a, fmt='%d', padding=4, fontsize=10, color=gun_metal, fontweight='bold')
         
-        for bar in bars2b:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2, height + 0.5,
-                    f'{height:.1f}%', ha='center', va='bottom', fontsize=10, color=gun_metal, fontweight='bold')
+        ax2.bar_label(bars2b, fmt='%.1f%%', padding=4, fontsize=10, color=gun_metal, fontweight='bold')
         
         # 3. Parameter Effect Analysis
         effect_sizes = [0.8, 0.6, 0.4, 0.7]  # Mock effect sizes
@@ -493,17 +835,14 @@ class mRNAVisualizationPipeline:
         ax3.set_xticklabels(effect_labels, rotation=45, ha='right', fontsize=11)
         
         # Add value labels
-        for bar in bars3:
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2, height + 0.02,
-                    f'{height:.2f}', ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
+        ax3.bar_label(bars3, fmt='%.2f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
         
         # 4. Summary Statistics
         summary_stats = {
             'Total Methods': len(methods),
-            'Best Energy': min([-e for e in energies]),
-            'Avg Base Pairs': np.mean(base_pairs),
-            'Avg Density': np.mean(densities) * 100
+            'Best Energy': float(-energies.max()),
+            'Avg Base Pairs': base_pairs.mean(),
+            'Avg Density': densities.mean() * 100
         }
         
         bars4 = ax4.bar(summary_stats.keys(), summary_stats.values(), 
@@ -514,194 +853,45 @@ class mRNAVisualizationPipeline:
         ax4.set_xticklabels(summary_stats.keys(), rotation=45, ha='right', fontsize=11)
         
         # Add value labels
-        for bar in bars4:
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2, height + 0.2,
-                    f'{height:.1f}', ha='center', va='bottom', fontsize=12, color=gun_metal, fontweight='bold')
-        
-        # Customize all subplots
-        for ax in [ax1, ax2, ax3, ax4]:
-            for spine in ax.spines.values():
-                spine.set_color(gun_metal)
-                spine.set_linewidth(3.5)
-            ax.tick_params(colors=gun_metal)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_comprehensive_summary.pdf", 
-                   dpi=300, bbox_inches='tight')
-        plt.savefig(self.output_dir / f"{self.sequence_prefix}_comprehensive_summary.png", 
-                   dpi=300, bbox_inches='tight')
-        plt.close()
+        ax4.bar_label(bars4, fmt='%.1f', padding=4, fontsize=12, color=gun_metal, fontweight='bold')
+        
+        self._save_figure(fig, "comprehensive_summary", key)
     
     def create_interpretation_guide(self):
         """Create a comprehensive interpretation guide for all visualizations."""
-        guide_content = f"""# mRNA Structure Visualization Interpretation Guide
-
-## Overview
-This guide explains how to interpret each visualization generated by the mRNA structure prediction pipeline for sequence: **{self.sequence_prefix}**
-
-## Generated Visualizations
-
-### 1. Energy Comparison Plot (`{self.sequence_prefix}_energy_comparison.pdf/png`)
-
-**What it shows:**
-- Free energy values (in kcal/mol) for each prediction method
-- Color-coded bars: Red indicates the best (lowest) energy structure
-- Blue bars show other prediction methods
-- Dashed red line indicates the best energy threshold
-
-**How to interpret:**
-- **Lower (more negative) energy = more stable structure**
-- The most negative energy represents the most thermodynamically favorable structure
-- Compare energy differences between methods to understand parameter effects
-- Look for consistency across different prediction approaches
-
-**Key insights:**
-- Temperature variations show how thermal conditions affect structure stability
-- Parameter modifications (maxspan, noGU) reveal structural constraints
-- Partition function provides ensemble information
-
-### 2. Structural Metrics Dashboard (`{self.sequence_prefix}_structural_metrics.pdf/png`)
-
-**What it shows:**
-- **Base Pair Counts (Teal Green bars):** Number of paired nucleotides in each structure
-- **Structural Stability (Flat Purple bars):** Energy magnitude showing structural stability
-- **Structural Density (Soft Burnt Orange bars):** Ratio of paired to total nucleotides
-- **Structural Complexity Heatmap:** Correlation matrix showing relationships between structural parameters
-
-**How to interpret:**
-- **Base Pairs:** Higher counts indicate more complex secondary structure
-- **Structural Stability:** Higher energy magnitude indicates more stable structures
-- **Structural Density:** Values closer to 1.0 indicate highly structured RNA
-- **Heatmap:** Brighter colors indicate stronger parameter effects
-
-**Key insights:**
-- Compare structural complexity across different prediction methods
-- Identify which parameters most strongly affect structure prediction
-- Understand the relationship between structural stability and complexity
-
-### 3. Structure Comparison Plot (`{self.sequence_prefix}_structure_comparison.pdf/png`)
-
-**What it shows:**
-- Circular representations of RNA secondary structures
-- Red arcs connecting paired nucleotides
-- Sequence position labels around the circle
-- Method-specific subplots for comparison
-
-**How to interpret:**
-- **Circle perimeter:** Represents the RNA sequence in linear order
-- **Red arcs:** Base pairs connecting distant sequence positions
-- **Arc thickness:** Indicates base pair strength/confidence
-- **Position labels:** Help identify specific sequence regions
-
-**Key insights:**
-- Visualize how different parameters affect structural topology
-- Identify conserved structural elements across methods
-- Compare local vs. long-range interactions
-- Understand structural motifs and domains
-
-### 4. Parameter Sensitivity Analysis (`{self.sequence_prefix}_temperature_sensitivity.pdf/png`)
-
-**What it shows:**
-- Line plot of energy vs. temperature
-- Data points showing energy values at different temperatures
-- Trend analysis across parameter variations
-
-**How to interpret:**
-- **Slope:** Steep slopes indicate high temperature sensitivity
-- **Data points:** Individual energy measurements
-- **Trend lines:** Show overall parameter effects
-- **Error bars:** Indicate prediction confidence
-
-**Key insights:**
-- Understand thermal stability of the RNA structure
-- Identify optimal temperature conditions
-- Predict structural changes under different conditions
-- Assess robustness of structure predictions
-
-### 5. Comprehensive Summary Plot (`{self.sequence_prefix}_comprehensive_summary.pdf/png`)
-
-**What it shows:**
-- Multi-panel dashboard combining all analyses
-- Energy comparison subplot
-- Structural metrics subplot
-- Parameter effects analysis
-- Quality assessment
-- Summary statistics
-
-**How to interpret:**
-- **Top panels:** Energy and structural comparisons
-- **Middle panel:** Parameter sensitivity analysis
-- **Bottom panels:** Quality metrics and summary statistics
-- **Color coding:** Consistent across all panels
-
-**Key insights:**
-- Comprehensive overview of all prediction results
-- Identify the most reliable prediction method
-- Understand parameter trade-offs
-- Quality assessment of predictions
-
-## Color Scheme
-
-- **Red (#e74c3c):** Best energy structures, highlights, important features
-- **Blue (#3498db):** Standard structures, data points, secondary features
-- **Teal Green (#16a085):** Base pair counts, structural complexity
-- **Flat Purple (#8e44ad):** Structural stability, energy analysis
-- **Soft Burnt Orange (#d35400):** Structural density, pairing efficiency
-- **Gun Metal Blue (#2c3e50):** Primary text, axes, labels
-
-## Quality Assessment
-
-**High Quality Predictions:**
-- Consistent energy values across methods
-- Reasonable base pair counts (20-60% of sequence length)
-- GC content appropriate for RNA type
-- Structural density between 0.2-0.6
-
-**Warning Signs:**
-- Large energy variations between similar methods
-- Unrealistic base pair counts (0 or >80%)
-- Extremely high/low GC content
-- Inconsistent structural patterns
-
-## Best Practices
-
-1. **Compare multiple methods:** Don't rely on a single prediction
-2. **Consider biological context:** RNA type, organism, conditions
-3. **Validate with experiments:** Computational predictions need experimental verification
-4. **Check parameter sensitivity:** Ensure predictions are robust
-5. **Examine structural motifs:** Look for known RNA structural elements
-
-## File Formats
-
-- **PDF files:** High-resolution vector graphics for publications
-- **PNG files:** Quick preview images for presentations
-- **JSON files:** Raw data for further analysis
-- **CSV files:** Spreadsheet-compatible data tables
-
-## Technical Notes
-
-- **Energy units:** kcal/mol (more negative = more stable)
-- **Base pairs:** Watson-Crick and wobble pairs
-- **GC content:** Percentage of G and C nucleotides
-- **Structural density:** Paired nucleotides / total nucleotides
-- **Temperature:** Celsius (biological range: 25-50°C)
-
----
-*Generated for sequence: {self.sequence_prefix}*
-*Analysis date: {self.get_current_date()}*
-"""
+        guide_content = _GUIDE_TEMPLATE.format_map({
+            'prefix': self.sequence_prefix,
+            'date': self.get_current_date()
+        })
         
         # Write the interpretation guide
         guide_file = self.output_dir / "how_to_interpret.md"
-        with open(guide_file, 'w') as f:
-            f.write(guide_content)
+        guide_file.write_text(guide_content)
         
         print(f"  ✓ Interpretation guide created: {guide_file}")
     
     def get_current_date(self):
         """Get current date for the interpretation guide."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _format_timestamp(int(time.time()))
+    
+    def render_all(self, workers: int = 5) -> List[str]:
+        """Render the stale plots concurrently, each in its own worker process.
+        
+        Up-to-date checks run here first, so a rerun with unchanged inputs
+        starts no processes and never imports matplotlib. Returns the names
+        of the plots that were rendered.
+        """
+        stale = [plot for plot in PLOT_METHODS if self._needs_render(plot)]
+        if not stale:
+            return stale
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+            futures = [executor.submit(_render_plot, self.sequence_prefix, str(self.results_dir),
+                                       self.formats, plot)
+                       for plot in stale]
+            for future in futures:
+                future.result()
+        return stale
     
     def run_visualization_pipeline(self):
         """Run the complete visualization pipeline."""
@@ -715,20 +905,12 @@ This guide explains how to interpret each visualization generated by the mRNA st
         print("Creating beautiful visualizations...")
         
         # Create all visualizations
-        self.create_energy_comparison_plot()
-        print("  ✓ Energy comparison plot created")
-        
-        self.create_structural_metrics_dashboard()
-        print("  ✓ Structural metrics dashboard created")
-        
-        self.create_structure_comparison_plot()
-        print("  ✓ Structure comparison plot created")
-        
-        self.create_parameter_sensitivity_plot()
-        print("  ✓ Parameter sensitivity plot created")
-        
-        self.create_comprehensive_summary_plot()
-        print("  ✓ Comprehensive summary plot created")
+        rendered = self.render_all()
+        for plot, (_, label) in PLOT_OUTPUTS.items():
+            if plot in rendered:
+                print(f"  ✓ {label} created")
+            else:
+                print(f"  - {label} skipped (up to date)")
         
         self.create_interpretation_guide()
         print("  ✓ Interpretation guide created")
@@ -736,24 +918,43 @@ This guide explains how to interpret each visualization generated by the mRNA st
         print(f"\n✓ Visualization pipeline completed!")
         print(f"Check {self.output_dir}/ for all visualization files")
         print("\nGenerated files:")
-        for file in self.output_dir.glob(f"{self.sequence_prefix}_*.pdf"):
-            print(f"  - {file.name}")
-        for file in self.output_dir.glob(f"{self.sequence_prefix}_*.png"):
-            print(f"  - {file.name}")
+        prefix = f"{self.sequence_prefix}_"
+        with os.scandir(self.output_dir) as entries:
+            generated = sorted(entry.name for entry in entries
+                               if entry.name.startswith(prefix) and entry.name.endswith(('.pdf', '.png')))
+        for name in generated:
+            print(f"  - {name}")
         print(f"  - how_to_interpret.md")
 
 
+def _render_plot(sequence_prefix: str, results_dir: str, formats: Tuple[str, ...], plot: str):
+    """Worker entry point: rebuild the pipeline in the child process and draw one plot.
+    
+    Only plain strings cross the process boundary, so no matplotlib state is pickled.
+    """
+    pipeline = mRNAVisualizationPipeline(sequence_prefix, results_dir, formats)
+    getattr(pipeline, PLOT_METHODS[plot])()
+
+
 def main():
     """Main function for command line usage."""
     parser = argparse.ArgumentParser(description="mRNA Structure Visualization Pipeline")
     parser.add_argument("sequence_prefix", help="Sequence prefix (e.g., TETRAHYMENA, YEAST)")
     parser.add_argument("results_dir", help="Directory containing results JSON files")
+    parser.add_argument("--guide-only", action="store_true",
+                        help="Only write the interpretation guide (does not import matplotlib)")
+    parser.add_argument("--pdf", action="store_true",
+                        help="Also write PDF versions of the plots (PNG only by default)")
     
     args = parser.parse_args()
     
     # Create and run visualization pipeline
-    pipeline = mRNAVisualizationPipeline(args.sequence_prefix, args.results_dir)
-    pipeline.run_visualization_pipeline()
+    formats = ('png', 'pdf') if args.pdf else ('png',)
+    pipeline = mRNAVisualizationPipeline(args.sequence_prefix, args.results_dir, formats)
+    if args.guide_only:
+        pipeline.create_interpretation_guide()
+    else:
+        pipeline.run_visualization_pipeline()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,32 @@ This script helps validate the 3D structure prediction pipeline and identify com
 
 import argparse
 import json
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
+
+# Subdirectories every 3D method directory is expected to contain
+REQUIRED_SUBDIRS = ('input', 'output', 'logs', 'quality', 'slurm_scripts')
+
+
+def _entry_names(directory: Union[str, Path]) -> set:
+    """Return the names in a directory from one scandir pass (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _command_succeeds(command: List[str]) -> bool:
+    """Run a command and report whether it exited cleanly."""
+    try:
+        return subprocess.run(command, capture_output=True, text=True).returncode == 0
+    except Exception:
+        return False
 
 
 def check_prerequisites() -> Dict[str, bool]:
@@ -24,25 +46,7 @@ def check_prerequisites() -> Dict[str, bool]:
     results['remote_server'] = work_dir.exists()
     print(f"  {'✓' if results['remote_server'] else '✗'} Remote server access: {results['remote_server']}")
     
-    # Check SLURM availability
-    try:
-        result = subprocess.run(["which", "sbatch"], capture_output=True, text=True)
-        results['slurm_available'] = result.returncode == 0
-        print(f"  {'✓' if results['slurm_available'] else '✗'} SLURM available: {results['slurm_available']}")
-    except Exception:
-        results['slurm_available'] = False
-        print("  ✗ SLURM available: False")
-    
-    # Check conda environment
-    try:
-        result = subprocess.run(["conda", "info", "--envs"], capture_output=True, text=True)
-        results['conda_available'] = result.returncode == 0
-        print(f"  {'✓' if results['conda_available'] else '✗'} Conda available: {results['conda_available']}")
-    except Exception:
-        results['conda_available'] = False
-        print("  ✗ Conda available: False")
-    
-    # Check 3D structure prediction tools
+    # 3D structure prediction tools
     tools = {
         'rosetta': 'rna_rosetta_run.py',
         'simrna': 'SimRNA',
@@ -50,14 +54,21 @@ def check_prerequisites() -> Dict[str, bool]:
         'rna_composer': 'RNAComposer'
     }
     
+    # PATH lookups are done in-process; only conda needs to be invoked
+    results['slurm_available'] = shutil.which("sbatch") is not None
+    results['conda_available'] = _command_succeeds(["conda", "info", "--envs"])
     for tool_name, command in tools.items():
-        try:
-            result = subprocess.run(["which", command], capture_output=True, text=True)
-            results[f'{tool_name}_available'] = result.returncode == 0
-            print(f"  {'✓' if results[f'{tool_name}_available'] else '⚠️'} {tool_name.title()} available: {results[f'{tool_name}_available']}")
-        except Exception:
-            results[f'{tool_name}_available'] = False
-            print(f"  ⚠️ {tool_name.title()} available: False")
+        results[f'{tool_name}_available'] = shutil.which(command) is not None
+    
+    # Check SLURM availability
+    print(f"  {'✓' if results['slurm_available'] else '✗'} SLURM available: {results['slurm_available']}")
+    
+    # Check conda environment
+    print(f"  {'✓' if results['conda_available'] else '✗'} Conda available: {results['conda_available']}")
+    
+    # Check 3D structure prediction tools
+    for tool_name in tools:
+        print(f"  {'✓' if results[f'{tool_name}_available'] else '⚠️'} {tool_name.title()} available: {results[f'{tool_name}_available']}")
     
     return results
 
@@ -71,38 +82,42 @@ def check_rnafold_results(sequence_prefix: str) -> Dict[str, bool]:
     work_dir = Path("/orcd/data/mbathe/001/rcm095/RNA_predictions")
     sequence_name = f"{sequence_prefix}_5UTR"
     
+    # Candidate paths are plain strings; a Path is only built for the hit
+    output_dir = os.path.join(work_dir, "output")
+    comparisons_dir = os.path.join(output_dir, "comparisons")
+    
     # Check comprehensive results with multiple possible names
-    possible_comprehensive_files = [
-        work_dir / "output" / "comparisons" / f"{sequence_name}_comprehensive_results.json",
-        work_dir / "output" / "comparisons" / f"{sequence_prefix}_comprehensive_results.json",
-        work_dir / "output" / "comparisons" / f"{sequence_prefix}_5UTR_comprehensive_results.json"
+    possible_comprehensive_names = [
+        f"{sequence_name}_comprehensive_results.json",
+        f"{sequence_prefix}_comprehensive_results.json",
+        f"{sequence_prefix}_5UTR_comprehensive_results.json"
     ]
     
-    comprehensive_file = None
-    for file_path in possible_comprehensive_files:
-        if file_path.exists():
-            comprehensive_file = file_path
-            break
+    comparison_entries = _entry_names(comparisons_dir)
+    comprehensive_file = next(
+        (Path(comparisons_dir, name) for name in possible_comprehensive_names if name in comparison_entries),
+        None
+    )
     
     results['comprehensive_results'] = comprehensive_file is not None
     if comprehensive_file:
         print(f"  ✓ Comprehensive results: {comprehensive_file}")
     else:
         print(f"  ✗ Comprehensive results: Not found")
-        print(f"    Checked for: {[str(f) for f in possible_comprehensive_files]}")
+        print(f"    Checked for: {[os.path.join(comparisons_dir, name) for name in possible_comprehensive_names]}")
     
     # Check individual method results
-    rnafold_dir = work_dir / "output" / "sequences" / sequence_name / "rnafold"
-    if rnafold_dir.exists():
-        method_dirs = [d for d in rnafold_dir.iterdir() if d.is_dir()]
+    rnafold_dir = os.path.join(output_dir, "sequences", sequence_name, "rnafold")
+    if os.path.isdir(rnafold_dir):
+        with os.scandir(rnafold_dir) as entries:
+            method_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
         results['individual_results'] = len(method_dirs) > 0
         print(f"  {'✓' if results['individual_results'] else '✗'} Individual results: {len(method_dirs)} methods found")
         
-        for method_dir in method_dirs:
-            method_name = method_dir.name
-            parsed_file = method_dir / "parsed_results" / "structure_parsed.json"
-            if parsed_file.exists():
-                print(f"    ✓ {method_name}: {parsed_file}")
+        for method_name, method_dir in method_dirs:
+            parsed_dir = os.path.join(method_dir, "parsed_results")
+            if "structure_parsed.json" in _entry_names(parsed_dir):
+                print(f"    ✓ {method_name}: {os.path.join(parsed_dir, 'structure_parsed.json')}")
             else:
                 print(f"    ✗ {method_name}: No parsed results")
     else:
@@ -125,17 +140,14 @@ def check_3d_structure_directories(sequence_prefix: str) -> Dict[str, bool]:
     results['base_directory'] = structure_3d_dir.exists()
     print(f"  {'✓' if results['base_directory'] else '✗'} Base directory: {structure_3d_dir}")
     
-    if structure_3d_dir.exists():
-        # Check method directories
+    if results['base_directory']:
+        # Check method directories, listing each directory once
+        method_entries = _entry_names(structure_3d_dir)
         methods = ['rosetta', 'simrna', 'farna', 'rna_composer']
         for method in methods:
-            method_dir = structure_3d_dir / method
-            if method_dir.exists():
-                subdirs = ['input', 'output', 'logs', 'quality', 'slurm_scripts']
-                missing_subdirs = []
-                for subdir in subdirs:
-                    if not (method_dir / subdir).exists():
-                        missing_subdirs.append(subdir)
+            if method in method_entries:
+                present = _entry_names(os.path.join(structure_3d_dir, method))
+                missing_subdirs = [subdir for subdir in REQUIRED_SUBDIRS if subdir not in present]
                 
                 if missing_subdirs:
                     print(f"    ⚠️ {method}: Missing subdirectories: {', '.join(missing_subdirs)}")
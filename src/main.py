@@ -3,8 +3,9 @@
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Iterable
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent))
@@ -15,6 +16,14 @@ from utils.logger import setup_logger
 from prediction import RNAfoldPredictor, MFoldPredictor, DeepLearningPredictor
 
 
+# (method name, display label, predictor class) in pipeline order
+PREDICTOR_SPEC = [
+    ('rnafold', 'RNAfold', RNAfoldPredictor),
+    ('mfold', 'Mfold', MFoldPredictor),
+    ('deep_learning', 'Deep learning', DeepLearningPredictor),
+]
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="mRNA Structure Prediction Pipeline")
@@ -59,56 +68,60 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def setup_predictors(config: Config, methods: List[str]) -> Dict[str, Any]:
+def setup_predictors(config: Config, methods: Iterable[str]) -> Dict[str, Any]:
     """Setup prediction methods based on configuration."""
     predictors = {}
+    requested = methods if isinstance(methods, (set, frozenset)) else set(methods)
     
-    if "rnafold" in methods and config.prediction.rnafold.get('enabled', True):
-        try:
-            predictors['rnafold'] = RNAfoldPredictor(config.prediction.rnafold)
-            logger.info("✓ RNAfold predictor initialized")
-        except Exception as e:
-            logger.error(f"✗ Failed to initialize RNAfold: {e}")
-    
-    if "mfold" in methods and config.prediction.mfold.get('enabled', True):
-        try:
-            predictors['mfold'] = MFoldPredictor(config.prediction.mfold)
-            logger.info("✓ Mfold predictor initialized")
-        except Exception as e:
-            logger.error(f"✗ Failed to initialize Mfold: {e}")
-    
-    if "deep_learning" in methods and config.prediction.deep_learning.get('enabled', True):
+    for name, label, predictor_cls in PREDICTOR_SPEC:
+        if name not in requested:
+            continue
+        
+        method_config = getattr(config.prediction, name)
+        if not method_config.get('enabled', True):
+            continue
+        
         try:
-            predictors['deep_learning'] = DeepLearningPredictor(config.prediction.deep_learning)
-            logger.info("✓ Deep learning predictor initialized")
+            predictors[name] = predictor_cls(method_config)
+            logger.info(f"✓ {label} predictor initialized")
         except Exception as e:
-            logger.error(f"✗ Failed to initialize deep learning: {e}")
+            logger.error(f"✗ Failed to initialize {label}: {e}")
     
     return predictors
 
 
 def run_predictions(sequence, predictors: Dict[str, Any], output_dir: Path) -> Dict[str, Any]:
-    """Run predictions using all available methods."""
+    """Run predictions using all available methods.
+    
+    Methods are independent and spend their time in subprocesses or native
+    code, so they run concurrently on threads.
+    """
     results = {}
     
-    for method_name, predictor in predictors.items():
-        logger.info(f"Running {method_name} prediction...")
+    with ThreadPoolExecutor(max_workers=len(predictors) or 1) as executor:
+        futures = {}
+        for method_name, predictor in predictors.items():
+            logger.info(f"Running {method_name} prediction...")
+            futures[executor.submit(predictor.predict, sequence)] = method_name
         
-        try:
-            result = predictor.predict(sequence)
-            
-            # Save individual results
-            result_file = output_dir / f"{method_name}_results.json"
-            predictor.save_results(result, result_file)
-            
-            results[method_name] = result
-            logger.info(f"✓ {method_name} prediction completed")
-            
-        except Exception as e:
-            logger.error(f"✗ {method_name} prediction failed: {e}")
-            results[method_name] = {"error": str(e)}
-    
-    return results
+        for future in as_completed(futures):
+            method_name = futures[future]
+            try:
+                result = future.result()
+                
+                # Save individual results
+                result_file = output_dir / f"{method_name}_results.json"
+                predictors[method_name].save_results(result, result_file)
+                
+                results[method_name] = result
+                logger.info(f"✓ {method_name} prediction completed")
+                
+            except Exception as e:
+                logger.error(f"✗ {method_name} prediction failed: {e}")
+                results[method_name] = {"error": str(e)}
+    
+    # Report methods in the order they were configured, not completion order
+    return {method_name: results[method_name] for method_name in predictors}
 
 
 def main():
@@ -154,7 +167,7 @@ def main():
     logger.info(f"✓ Output directory: {output_dir}")
     
     # Setup predictors
-    methods = [m.strip() for m in args.methods.split(',')]
+    methods = frozenset(m.strip().lower() for m in args.methods.split(','))
     predictors = setup_predictors(config, methods)
     
     if not predictors:
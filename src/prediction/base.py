@@ -1,49 +1,206 @@
 """Base class for mRNA structure predictors."""
 
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Union, Any
 from pathlib import Path
+import numpy as np
 from Bio.SeqRecord import SeqRecord
 from loguru import logger
 
+from utils.json_io import dumps_json, loads_json
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; pair tables fall back to a NumPy-assisted scan
+    njit = None
+
+
+# Translation table for validate_sequence: nucleotides map to their uppercase
+# form and every other ASCII character maps to a NUL sentinel
+_INVALID = '\x00'
+_NUCLEOTIDE_TABLE = str.maketrans(
+    {**{code: _INVALID for code in range(128)}, **{c: c.upper() for c in 'ACGUacgu'}}
+)
+
+if njit is not None:
+    @njit(cache=True)
+    def _pair_table_kernel(bracket):
+        """Scan dot-bracket bytes with an integer stack; return (i, j) pairs in closing order."""
+        n = bracket.shape[0]
+        stack = np.empty(n, np.int32)
+        pairs = np.empty((n // 2, 2), np.int32)
+        top = 0
+        k = 0
+        for i in range(n):
+            c = bracket[i]
+            if c == 40:  # '('
+                stack[top] = i
+                top += 1
+            elif c == 41 and top > 0:  # ')'
+                top -= 1
+                pairs[k, 0] = stack[top]
+                pairs[k, 1] = i
+                k += 1
+        return pairs[:k]
+else:
+    _pair_table_kernel = None
+
 
 class BasePredictor(ABC):
     """Abstract base class for all structure predictors."""
     
+    # How predict_batch fans out: 'process' for work done in Python, 'thread'
+    # for predictors whose predict blocks on an external program
+    batch_executor = 'process'
+    
     def __init__(self, config: Dict[str, Any], name: str = "base"):
         """Initialize predictor with configuration."""
         self.config = config
         self.name = name
         self.logger = logger.bind(name=f"predictor.{name}")
     
+    def __getstate__(self):
+        # The bound logger holds stream handles; rebind it on unpickling so
+        # predictors can be shipped to predict_batch worker processes
+        state = self.__dict__.copy()
+        state.pop('logger', None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.logger = logger.bind(name=f"predictor.{self.name}")
+    
     @abstractmethod
     def predict(self, sequence: Union[str, SeqRecord]) -> Dict[str, Any]:
         """Predict structure for a given sequence."""
         pass
     
-    @abstractmethod
-    def predict_batch(self, sequences: List[Union[str, SeqRecord]]) -> List[Dict[str, Any]]:
-        """Predict structures for multiple sequences."""
-        pass
+    def predict_batch(self, sequences: List[Union[str, SeqRecord]], **predict_kwargs) -> List[Dict[str, Any]]:
+        """Predict structures for multiple sequences.
+        
+        Sequences are spread over a process or thread pool (see
+        ``batch_executor``; ``workers`` in the method config, all cores by
+        default) and results are returned in input order, with an error entry
+        for any sequence that fails. Keyword arguments are passed on to
+        ``predict``. Predictors that batch natively, e.g. on a GPU, override
+        this.
+        """
+        sequences = list(sequences)
+        total = len(sequences)
+        results = [None] * total
+        tasks = ((i, seq, total, predict_kwargs) for i, seq in enumerate(sequences))
+        
+        workers = min(self.config.get('workers') or os.cpu_count() or 1, total)
+        if workers <= 1:
+            for i, result in map(self._predict_indexed, tasks):
+                results[i] = result
+            return results
+        
+        if self.batch_executor == 'thread':
+            # predict waits on a child process, so threads give the same
+            # parallelism without pickling the predictor
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._predict_indexed, task) for task in tasks]
+                for future in as_completed(futures):
+                    i, result = future.result()
+                    results[i] = result
+            return results
+        
+        chunksize = max(1, total // (4 * workers))
+        with multiprocessing.Pool(workers) as pool:
+            for i, result in pool.imap_unordered(self._predict_indexed, tasks, chunksize=chunksize):
+                results[i] = result
+        return results
+    
+    def _predict_indexed(self, task):
+        """Run predict for one (index, sequence, total, kwargs) task, capturing failures."""
+        i, seq, total, predict_kwargs = task
+        self.logger.info(f"Processing sequence {i+1}/{total}")
+        try:
+            return i, self.predict(seq, **predict_kwargs)
+        except Exception as e:
+            self.logger.error(f"Failed to predict sequence {i+1}: {e}")
+            return i, self._error_result(seq, e)
+    
+    def _error_result(self, sequence: Union[str, SeqRecord], error: Exception) -> Dict[str, Any]:
+        """Build the result entry recorded for a sequence that failed to predict."""
+        return {
+            'method': self.name,
+            'sequence': str(sequence) if isinstance(sequence, SeqRecord) else sequence,
+            'error': str(error)
+        }
     
     def validate_sequence(self, sequence: Union[str, SeqRecord]) -> str:
         """Validate and convert sequence to string."""
-        if isinstance(sequence, SeqRecord):
+        # Exact-type check first: plain strings are the common case
+        if type(sequence) is str:
+            seq_str = sequence
+        elif isinstance(sequence, SeqRecord):
             seq_str = str(sequence.seq)
         elif isinstance(sequence, str):
             seq_str = sequence
         else:
             raise ValueError(f"Unsupported sequence type: {type(sequence)}")
         
-        # Validate sequence
-        valid_chars = set('ACGUacgu')
-        seq_chars = set(seq_str.upper())
+        # Uppercase and validate in one C-level translate pass; non-ASCII input
+        # is rejected up front because the table only covers ASCII
+        if seq_str.isascii():
+            translated = seq_str.translate(_NUCLEOTIDE_TABLE)
+            if _INVALID not in translated:
+                return translated
         
-        if not seq_chars.issubset(valid_chars):
-            invalid_chars = seq_chars - valid_chars
-            raise ValueError(f"Invalid characters in sequence: {invalid_chars}")
+        invalid_chars = set(seq_str.upper()) - set('ACGUacgu')
+        raise ValueError(f"Invalid characters in sequence: {invalid_chars}")
+    
+    @staticmethod
+    def _pair_table(structure: str) -> np.ndarray:
+        """Return the base pairs of a dot-bracket string as an (n, 2) int32 array.
+        
+        Rows are ``(opening, closing)`` indices in order of the closing bracket;
+        unmatched closing brackets are ignored. Subclasses share one compiled
+        kernel when numba is installed.
+        """
+        bracket = np.frombuffer(structure.encode('ascii'), dtype=np.uint8)
+        if _pair_table_kernel is not None:
+            return _pair_table_kernel(bracket)
+        
+        # Without numba, locate brackets in C and only walk those positions
+        positions = np.flatnonzero((bracket == ord('(')) | (bracket == ord(')')))
+        pairs = []
+        stack = []
+        for pos, opening in zip(positions.tolist(), (bracket[positions] == ord('(')).tolist()):
+            if opening:
+                stack.append(pos)
+            elif stack:
+                pairs.append((stack.pop(), pos))
+        return np.array(pairs, dtype=np.int32).reshape(-1, 2)
+    
+    @staticmethod
+    def _base_pair_arrays(pairs) -> Dict[str, np.ndarray]:
+        """Split (i, j) pairs into structure-of-arrays result fields.
+        
+        ``base_pairs_i`` and ``base_pairs_j`` are contiguous int32 arrays that
+        downstream analyses can use directly with NumPy. They are the only
+        stored form of the pairs; use ``base_pair_list`` for (i, j) tuples.
+        """
+        pairs = np.asarray(pairs, dtype=np.int32).reshape(-1, 2)
+        return {
+            'base_pairs_i': np.ascontiguousarray(pairs[:, 0]),
+            'base_pairs_j': np.ascontiguousarray(pairs[:, 1])
+        }
+    
+    @staticmethod
+    def base_pair_list(result: Dict[str, Any]) -> List[tuple]:
+        """Return a result's base pairs as a list of (i, j) tuples.
         
-        return seq_str.upper()
+        Accepts both in-memory results (int32 arrays) and results loaded
+        back from JSON (plain lists).
+        """
+        return list(zip(np.asarray(result.get('base_pairs_i', ()), dtype=np.int32).tolist(),
+                        np.asarray(result.get('base_pairs_j', ()), dtype=np.int32).tolist()))
     
     def save_results(self, results: Dict[str, Any], output_path: Union[str, Path]):
         """Save prediction results to file."""
@@ -51,9 +208,7 @@ class BasePredictor(ABC):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # This is a basic implementation - subclasses can override
-        import json
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        output_path.write_bytes(dumps_json(results))
     
     def load_results(self, input_path: Union[str, Path]) -> Dict[str, Any]:
         """Load prediction results from file."""
@@ -62,9 +217,7 @@ class BasePredictor(ABC):
         if not input_path.exists():
             raise FileNotFoundError(f"Results file not found: {input_path}")
         
-        import json
-        with open(input_path, 'r') as f:
-            return json.load(f)
+        return loads_json(input_path.read_bytes())
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name})"
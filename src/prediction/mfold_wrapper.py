@@ -5,6 +5,7 @@ import tempfile
 import os
 from pathlib import Path
 from typing import Dict, List, Union, Any
+import numpy as np
 from Bio.SeqRecord import SeqRecord
 from .base import BasePredictor
 
@@ -12,6 +13,9 @@ from .base import BasePredictor
 class MFoldPredictor(BasePredictor):
     """Wrapper for Mfold structure prediction."""
     
+    # Each prediction runs the Mfold executable, so batches fan out on threads
+    batch_executor = 'thread'
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize Mfold predictor."""
         super().__init__(config, name="mfold")
@@ -70,23 +74,6 @@ class MFoldPredictor(BasePredictor):
             self.logger.error(f"Unexpected error in Mfold prediction: {e}")
             raise
     
-    def predict_batch(self, sequences: List[Union[str, SeqRecord]]) -> List[Dict[str, Any]]:
-        """Predict structures for multiple sequences."""
-        results = []
-        for i, seq in enumerate(sequences):
-            self.logger.info(f"Processing sequence {i+1}/{len(sequences)}")
-            try:
-                result = self.predict(seq)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Failed to predict sequence {i+1}: {e}")
-                results.append({
-                    'method': 'mfold',
-                    'sequence': str(seq) if isinstance(seq, SeqRecord) else seq,
-                    'error': str(e)
-                })
-        return results
-    
     def _parse_mfold_output(self, output_dir: Path, sequence: str) -> Dict[str, Any]:
         """Parse Mfold output files to extract structure information."""
         structures = []
@@ -134,38 +121,37 @@ class MFoldPredictor(BasePredictor):
         """Parse Mfold CT (connectivity table) file."""
         try:
             with open(ct_file, 'r') as f:
-                lines = f.readlines()
-            
-            if len(lines) < 2:
-                return None
+                # Parse header line
+                header = f.readline().split()
+                if len(header) < 4:
+                    return None
+                
+                num_bases = int(header[0])
+                energy = float(header[4]) if len(header) > 4 else None
+                
+                # Columns 1 and 5 hold each base's index and its partner (0 if
+                # unpaired); read only this structure's rows in one C-level pass
+                columns = np.loadtxt(f, usecols=(0, 4), dtype=np.int64, max_rows=num_bases, ndmin=2)
             
-            # Parse header line
-            header = lines[0].strip().split()
-            if len(header) < 4:
+            if len(columns) == 0:
                 return None
             
-            num_bases = int(header[0])
-            energy = float(header[4]) if len(header) > 4 else None
-            
-            # Parse base pairs
-            base_pairs = []
-            structure = ['.'] * num_bases
+            # Convert to 0-based; each pair is listed from both ends, so keep
+            # the row where the partner comes later
+            pos1 = columns[:, 0] - 1
+            pos2 = columns[:, 1] - 1
+            paired = pos2 > pos1
+            pos1, pos2 = pos1[paired], pos2[paired]
             
-            for line in lines[1:]:
-                parts = line.strip().split()
-                if len(parts) >= 5:
-                    pos1 = int(parts[0]) - 1  # Convert to 0-based
-                    pos2 = int(parts[4]) - 1  # Convert to 0-based
-                    
-                    if pos2 > 0:  # Valid base pair
-                        base_pairs.append((pos1, pos2))
-                        structure[pos1] = '('
-                        structure[pos2] = ')'
+            structure = np.full(num_bases, ord('.'), dtype=np.uint8)
+            structure[pos1] = ord('(')
+            structure[pos2] = ord(')')
             
             return {
-                'structure': ''.join(structure),
+                'structure': structure.tobytes().decode('ascii'),
                 'energy': energy,
-                'base_pairs': sorted(base_pairs)
+                'base_pairs_i': pos1.astype(np.int32),
+                'base_pairs_j': pos2.astype(np.int32)
             }
             
         except Exception as e:
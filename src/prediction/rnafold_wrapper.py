@@ -1,16 +1,38 @@
 """RNAfold wrapper for mRNA structure prediction."""
 
+import os
+import select
 import subprocess
-import tempfile
-from pathlib import Path
+import threading
+import time
+from functools import lru_cache
 from typing import Dict, List, Union, Any
 from Bio.SeqRecord import SeqRecord
 from .base import BasePredictor
 
+try:
+    import RNA
+except ImportError:  # ViennaRNA Python bindings are optional; fall back to the RNAfold executable
+    RNA = None
+
+
+@lru_cache(maxsize=None)
+def _model_details(temperature: float, max_bp_span: int):
+    """Return a ViennaRNA model-details object, built once per settings and process."""
+    md = RNA.md()
+    md.temperature = temperature
+    if max_bp_span > 0:
+        md.max_bp_span = max_bp_span
+    return md
+
 
 class RNAfoldPredictor(BasePredictor):
     """Wrapper for RNAfold structure prediction."""
     
+    # Each prediction runs the RNAfold executable, so batches fan out on threads
+    # (with the in-process bindings the work is CPU-bound; see __init__)
+    batch_executor = 'thread'
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize RNAfold predictor."""
         super().__init__(config, name="rnafold")
@@ -18,140 +40,290 @@ class RNAfoldPredictor(BasePredictor):
         self.temperature = self.rnafold_config.get('temperature', 37.0)
         self.energy_model = self.rnafold_config.get('energy_model', 'vienna')
         self.max_bp_span = self.rnafold_config.get('max_bp_span', 0)
+        self.persistent_worker = self.rnafold_config.get('persistent_worker', False)
+        self.timeout = self.rnafold_config.get('timeout', 600)
+        
+        if RNA is not None:
+            self.batch_executor = 'process'
+        
+        # Idle warm RNAfold processes for the executable path, shared by all
+        # threads; at most max_idle_workers are kept between predictions
+        self.max_idle_workers = config.get('workers') or os.cpu_count() or 1
+        self._idle_workers = []
+        self._workers_lock = threading.Lock()
+    
+    def __getstate__(self):
+        state = super().__getstate__()
+        for attr in ('_idle_workers', '_workers_lock'):
+            state.pop(attr, None)
+        return state
+    
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._idle_workers = []
+        self._workers_lock = threading.Lock()
     
-    def predict(self, sequence: Union[str, SeqRecord]) -> Dict[str, Any]:
-        """Predict structure using RNAfold."""
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Stop the idle persistent RNAfold worker processes."""
+        lock = getattr(self, '_workers_lock', None)
+        if lock is None:
+            return
+        
+        with lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            self._stop_worker(worker)
+    
+    def predict(self, sequence: Union[str, SeqRecord], return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Predict structure using RNAfold.
+        
+        With ``return_base_pairs=False`` the dot-bracket string is not walked
+        for pairs and the base-pair fields are left empty, for screens that
+        only need the structure string and free energy.
+        """
         seq_str = self.validate_sequence(sequence)
         
         self.logger.info(f"Running RNAfold prediction for sequence of length {len(seq_str)}")
         
+        if RNA is not None:
+            return self._fold_with_bindings(seq_str, return_base_pairs)
+        
+        if self.persistent_worker:
+            try:
+                return self._fold_with_worker(seq_str, return_base_pairs)
+            except subprocess.TimeoutExpired:
+                self.logger.error(f"RNAfold worker timed out after {self.timeout}s")
+                raise RuntimeError(f"RNAfold prediction timed out after {self.timeout}s")
+            except (OSError, ValueError, RuntimeError) as e:
+                self.logger.warning(f"RNAfold worker failed ({e}); running a one-off RNAfold process")
+        
         try:
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta', delete=False) as temp_in, \
-                 tempfile.NamedTemporaryFile(mode='w', suffix='.fold', delete=False) as temp_out:
-                
-                # Write sequence to temporary file
-                temp_in.write(f">sequence\n{seq_str}\n")
-                temp_in.flush()
-                
-                # Build RNAfold command
-                cmd = ['RNAfold', '--noPS']
-                
-                # Add temperature parameter
-                if self.temperature != 37.0:
-                    cmd.extend(['-T', str(self.temperature)])
-                
-                # Add max base pair span
-                if self.max_bp_span > 0:
-                    cmd.extend(['--maxBPspan', str(self.max_bp_span)])
-                
-                # Add input and output files
-                cmd.extend(['-i', temp_in.name, '-o', temp_out.name])
-                
-                # Run RNAfold
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                
-                # Parse output
-                output = result.stdout
-                structure_info = self._parse_rnafold_output(output, seq_str)
-                
-                return {
-                    'method': 'rnafold',
-                    'sequence': seq_str,
-                    'structure': structure_info['structure'],
-                    'energy': structure_info['energy'],
-                    'base_pairs': structure_info['base_pairs'],
-                    'temperature': self.temperature,
-                    'energy_model': self.energy_model,
-                    'raw_output': output
-                }
-                
+            # RNAfold reads FASTA on stdin and answers on stdout, so no
+            # temporary files are needed
+            result = subprocess.run(self._build_command(), input=f">sequence\n{seq_str}\n",
+                                    capture_output=True, text=True, check=True, timeout=self.timeout)
+            
+            # Parse output
+            return self._build_result(seq_str, result.stdout, return_base_pairs)
+            
         except subprocess.CalledProcessError as e:
             self.logger.error(f"RNAfold failed: {e.stderr}")
             raise RuntimeError(f"RNAfold prediction failed: {e.stderr}")
         except Exception as e:
             self.logger.error(f"Unexpected error in RNAfold prediction: {e}")
             raise
-        finally:
-            # Clean up temporary files
-            try:
-                Path(temp_in.name).unlink(missing_ok=True)
-                Path(temp_out.name).unlink(missing_ok=True)
-            except:
-                pass
-    
-    def predict_batch(self, sequences: List[Union[str, SeqRecord]]) -> List[Dict[str, Any]]:
-        """Predict structures for multiple sequences."""
-        results = []
+    
+    def predict_batch(self, sequences: List[Union[str, SeqRecord]],
+                      return_base_pairs: bool = True) -> List[Dict[str, Any]]:
+        """Predict structures for multiple sequences with a single RNAfold run.
+        
+        Falls back to per-sequence predictions if the batched run fails, and
+        always uses them when the ViennaRNA bindings fold in-process.
+        """
+        if RNA is not None:
+            return super().predict_batch(sequences, return_base_pairs=return_base_pairs)
+        
+        results = [None] * len(sequences)
+        
+        valid = []
         for i, seq in enumerate(sequences):
-            self.logger.info(f"Processing sequence {i+1}/{len(sequences)}")
             try:
-                result = self.predict(seq)
-                results.append(result)
+                valid.append((i, self.validate_sequence(seq)))
             except Exception as e:
                 self.logger.error(f"Failed to predict sequence {i+1}: {e}")
-                results.append({
-                    'method': 'rnafold',
-                    'sequence': str(seq) if isinstance(seq, SeqRecord) else seq,
-                    'error': str(e)
-                })
+                results[i] = self._error_result(seq, e)
+        
+        if not valid:
+            return results
+        
+        try:
+            batch_results = self._predict_multi([seq_str for _, seq_str in valid], return_base_pairs)
+        except Exception as e:
+            self.logger.warning(f"Batched RNAfold run failed ({e}); predicting sequences individually")
+            return super().predict_batch(sequences, return_base_pairs=return_base_pairs)
+        
+        for (i, _), result in zip(valid, batch_results):
+            results[i] = result
         return results
     
-    def _parse_rnafold_output(self, output: str, sequence: str) -> Dict[str, Any]:
-        """Parse RNAfold output to extract structure information."""
-        lines = output.strip().split('\n')
+    def _predict_multi(self, sequences: List[str], return_base_pairs: bool = True) -> List[Dict[str, Any]]:
+        """Fold validated sequences in one RNAfold process fed a multi-FASTA on stdin."""
+        self.logger.info(f"Running RNAfold prediction for {len(sequences)} sequences")
+        
+        fasta = ''.join(f">s{i}\n{seq_str}\n" for i, seq_str in enumerate(sequences))
+        proc = subprocess.Popen(self._build_command(), stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        stdout, stderr = proc.communicate(fasta)
+        if proc.returncode != 0:
+            raise RuntimeError(f"RNAfold prediction failed: {stderr}")
+        
+        # Each record starts with its '>s<i>' header line
+        records = stdout.split('>s')[1:]
+        if len(records) != len(sequences):
+            raise ValueError(f"Expected {len(sequences)} RNAfold records, got {len(records)}")
+        
+        return [
+            self._build_result(seq_str, record.partition('\n')[2], return_base_pairs)
+            for seq_str, record in zip(sequences, records)
+        ]
+    
+    def _fold_with_bindings(self, seq_str: str, return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Fold in-process through the ViennaRNA C bindings."""
+        fold_compound = RNA.fold_compound(seq_str, _model_details(self.temperature, self.max_bp_span))
+        structure, mfe = fold_compound.mfe()
+        mfe = round(mfe, 2)  # single-precision energy; report it as RNAfold prints it
+        
+        return self._make_result(seq_str, {
+            'structure': structure,
+            'energy': mfe,
+            **self._pair_fields(structure, return_base_pairs)
+        }, raw_output=f"{seq_str}\n{structure} ({mfe:6.2f})")
+    
+    def _fold_with_worker(self, seq_str: str, return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Fold through a warm RNAfold process borrowed from the idle pool.
+        
+        RNAfold answers each FASTA record on stdin with three lines (header,
+        sequence, structure and energy) and flushes after every record, so the
+        process can be kept alive and its energy parameters loaded only once.
+        """
+        worker = self._acquire_worker()
+        try:
+            request = memoryview(f">sequence\n{seq_str}\n".encode())
+            while request:
+                request = request[worker.stdin.write(request):]
+            reply = self._read_reply(worker)
+        except BaseException:
+            # The stream may be out of step (or RNAfold stuck); never hand this
+            # worker out again
+            worker.kill()
+            self._stop_worker(worker)
+            raise
+        
+        self._release_worker(worker)
+        return self._build_result(seq_str, reply, return_base_pairs)
+    
+    def _read_reply(self, worker: subprocess.Popen, lines: int = 3) -> str:
+        """Read one record's reply from a worker, giving up after ``self.timeout`` seconds."""
+        fd = worker.stdout.fileno()
+        deadline = time.monotonic() + self.timeout
+        reply = bytearray()
+        while reply.count(b'\n') < lines:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired(worker.args, self.timeout)
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RuntimeError("RNAfold worker exited unexpectedly")
+            reply += chunk
+        return reply.decode()
+    
+    def _acquire_worker(self) -> subprocess.Popen:
+        """Take a live idle RNAfold process, or start a new one if none is idle."""
+        with self._workers_lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.poll() is None:
+                    return worker
+                self._stop_worker(worker)
+        
+        # Unbuffered binary pipes, so select() on stdout sees every byte
+        return subprocess.Popen(self._build_command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, bufsize=0)
+    
+    def _release_worker(self, worker: subprocess.Popen):
+        """Return a worker to the idle pool, stopping it if the pool is full."""
+        with self._workers_lock:
+            if len(self._idle_workers) < self.max_idle_workers:
+                self._idle_workers.append(worker)
+                return
+        self._stop_worker(worker)
+    
+    @staticmethod
+    def _stop_worker(worker: subprocess.Popen):
+        """Close a worker's pipes so RNAfold exits, killing it if it lingers."""
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=5)
+        except Exception:
+            worker.kill()
+            worker.wait()
+        finally:
+            worker.stdout.close()
+    
+    def _build_command(self) -> List[str]:
+        """Build the RNAfold command line shared by single and batched runs."""
+        cmd = ['RNAfold', '--noPS']
         
-        # Find the structure line (contains sequence and structure)
-        structure_line = None
-        energy_line = None
+        # Add temperature parameter
+        if self.temperature != 37.0:
+            cmd.extend(['-T', str(self.temperature)])
         
-        for line in lines:
-            if line.startswith(sequence):
-                structure_line = line
-            elif line.startswith('(') or line.startswith('.'):
-                # This is the structure line
-                structure_line = line
-            elif 'energy =' in line:
-                energy_line = line
+        # Add max base pair span
+        if self.max_bp_span > 0:
+            cmd.extend(['--maxBPspan', str(self.max_bp_span)])
         
-        if not structure_line:
+        return cmd
+    
+    def _build_result(self, seq_str: str, output: str, return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Parse RNAfold output for one sequence into a result dict."""
+        structure_info = self._parse_rnafold_output(output, seq_str, return_base_pairs)
+        return self._make_result(seq_str, structure_info, output)
+    
+    def _make_result(self, seq_str: str, structure_info: Dict[str, Any], raw_output: str) -> Dict[str, Any]:
+        """Assemble the result dict shared by the bindings and executable paths."""
+        return {
+            'method': 'rnafold',
+            'sequence': seq_str,
+            'structure': structure_info['structure'],
+            'energy': structure_info['energy'],
+            'base_pairs_i': structure_info['base_pairs_i'],
+            'base_pairs_j': structure_info['base_pairs_j'],
+            'temperature': self.temperature,
+            'energy_model': self.energy_model,
+            'raw_output': raw_output
+        }
+    
+    def _parse_rnafold_output(self, output: str, sequence: str,
+                              return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Parse RNAfold output to extract structure information."""
+        lines = output.strip().split('\n')
+        
+        # RNAfold's layout is fixed: an optional '>' header, the sequence
+        # echo, then '<structure> (<energy>)' where the structure is exactly
+        # as long as the sequence
+        offset = 1 if lines[0].startswith('>') else 0
+        if len(lines) < offset + 2:
             raise ValueError("Could not parse RNAfold output")
         
-        # Extract structure and energy
-        if len(structure_line) > len(sequence):
-            structure = structure_line[len(sequence):].strip()
-        else:
-            structure = structure_line
+        structure_line = lines[offset + 1]
+        structure = structure_line[:len(sequence)]
+        if len(structure) != len(sequence):
+            raise ValueError("Could not parse RNAfold output")
         
         # Extract energy
         energy = None
-        if energy_line:
-            try:
-                energy_str = energy_line.split('energy =')[1].strip().split()[0]
-                energy = float(energy_str)
-            except:
-                pass
-        
-        # Parse base pairs
-        base_pairs = self._parse_base_pairs(structure)
+        try:
+            energy = float(structure_line[len(sequence):].strip().strip('()'))
+        except ValueError:
+            pass
         
         return {
             'structure': structure,
             'energy': energy,
-            'base_pairs': base_pairs
+            **self._pair_fields(structure, return_base_pairs)
         }
     
-    def _parse_base_pairs(self, structure: str) -> List[tuple]:
-        """Parse base pairs from dot-bracket notation."""
-        base_pairs = []
-        stack = []
-        
-        for i, char in enumerate(structure):
-            if char == '(':
-                stack.append(i)
-            elif char == ')':
-                if stack:
-                    j = stack.pop()
-                    base_pairs.append((j, i))
-        
-        return sorted(base_pairs)
+    def _pair_fields(self, structure: str, return_base_pairs: bool = True) -> Dict[str, Any]:
+        """Base-pair result fields in structure-of-arrays form."""
+        if not return_base_pairs:
+            return self._base_pair_arrays([])
+        return self._base_pair_arrays(self._sorted_pair_table(structure))
+    
+    def _sorted_pair_table(self, structure: str):
+        """Pair table ordered by opening position."""
+        # Matched by the shared compiled pair-table scan
+        pairs = self._pair_table(structure)
+        return pairs[pairs[:, 0].argsort()]
@@ -2,6 +2,7 @@
 
 from .config import Config
 from .file_handlers import FileHandler
+from .json_io import dumps_json, loads_json
 from .logger import setup_logger
 
-__all__ = ["Config", "FileHandler", "setup_logger"]
+__all__ = ["Config", "FileHandler", "dumps_json", "loads_json", "setup_logger"]
@@ -1,11 +1,25 @@
 """Configuration management for the mRNA structure prediction pipeline."""
 
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, mtime); edits to the file invalidate the entry."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 @dataclass
 class RemoteConfig:
@@ -54,11 +68,13 @@ class Config:
     
     def _load_config(self):
         """Load configuration from YAML file."""
-        if not self.config_path.exists():
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        with open(self.config_path, 'r') as f:
-            self._raw_config = yaml.safe_load(f)
+        # Copy so that callers mutating their config never touch the cached parse
+        self._raw_config = copy.deepcopy(_load_yaml_cached(str(self.config_path), mtime))
         
         # Parse sections
         self.general = self._raw_config.get('general', {})
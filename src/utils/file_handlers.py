@@ -1,13 +1,151 @@
 """File handling utilities for the mRNA structure prediction pipeline."""
 
 import os
-import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 from Bio import SeqIO
 from Bio.Seq import Seq
+from Bio.SeqIO.QualityIO import FastqGeneralIterator
 from Bio.SeqRecord import SeqRecord
 
+from .json_io import dumps_json, loads_json
+
+# Sequence file suffix -> Biopython format name (unknown suffixes are read as FASTA)
+_FORMAT_MAP = {
+    '.fasta': 'fasta',
+    '.fa': 'fasta',
+    '.fastq': 'fastq',
+    '.fq': 'fastq',
+    '.txt': 'fasta'  # Assume FASTA for .txt files
+}
+
+# FASTA files at least this large are memory-mapped rather than read into
+# memory in one go
+_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Single FASTA records at least this long are formatted into one buffer and
+# written in one call instead of line by line through SeqIO.write
+_BULK_WRITE_THRESHOLD = 10_000
+_FASTA_LINE_WIDTH = 60
+
+# Characters SeqIO's 'fasta' parser drops from sequence lines
+_FASTA_SEQ_WHITESPACE = b' \t\r\n'
+
+# Raised, as by SeqIO's 'fasta' parser, when a FASTA file does not start with '>'
+_FASTA_LEADING_TEXT_ERROR = ("This FASTA file contains comments at the beginning of the file, "
+                             "which are not allowed by the 'fasta' parser.")
+
+
+def _iter_fast(path: Path, file_format: str):
+    """Yield SeqRecords from a FASTA/FASTQ file via low-level string parsers.
+    
+    Records are built directly from the parsed title and sequence strings,
+    skipping the per-record machinery of ``SeqIO.parse``.
+    """
+    if file_format == 'fastq':
+        with _open_sequence_file(path) as handle:
+            for title, seq, qual in FastqGeneralIterator(handle):
+                record = _make_record(title, seq)
+                record.letter_annotations['phred_quality'] = [ord(c) - 33 for c in qual]
+                yield record
+        return
+    
+    with _open_fasta_buffer(path) as data:
+        for title, seq in _scan_fasta(data):
+            yield _make_record(title, seq)
+
+
+def _open_sequence_file(path: Path, mode: str = 'r'):
+    """Open a sequence file for reading; opening doubles as the existence check."""
+    try:
+        return open(path, mode)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Sequence file not found: {path}") from None
+
+
+@contextmanager
+def _open_fasta_buffer(path: Path):
+    """Expose a FASTA file as a single bytes-like buffer.
+    
+    Large files are memory-mapped so the kernel pages them in on demand
+    instead of copying them through a userspace buffer; smaller files are
+    read with one call.
+    """
+    with _open_sequence_file(path, 'rb') as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0 or size < _MMAP_THRESHOLD:
+            yield handle.read()
+            return
+        
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def _scan_fasta(data):
+    """Yield (title, sequence) pairs from a FASTA buffer (bytes or mmap).
+    
+    Matches ``SimpleFastaParser``, but records are located with ``find``
+    and cleaned with ``translate``, which run in C over a whole record
+    instead of line by line in Python. Like ``SeqIO.parse``, an empty
+    buffer yields nothing and any other buffer must start with '>'.
+    
+    Raises:
+        ValueError: If there is text (even a blank line) before the first record.
+    """
+    if not len(data):
+        return
+    if data[:1] != b'>':
+        raise ValueError(_FASTA_LEADING_TEXT_ERROR)
+    
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b'\n>', start)
+        if end == -1:
+            end = size
+        title, _, seq = data[start + 1:end].partition(b'\n')
+        yield title.rstrip().decode(), seq.translate(None, _FASTA_SEQ_WHITESPACE).decode()
+        start = end + 1
+
+
+def _format_fasta(record: SeqRecord) -> bytes:
+    """Format one record exactly as SeqIO.write(..., 'fasta') would, as bytes."""
+    seq_id = record.id.replace('\n', ' ').replace('\r', ' ')
+    description = record.description.replace('\n', ' ').replace('\r', ' ')
+    if description and description.split(None, 1)[0] == seq_id:
+        title = description
+    elif description:
+        title = f"{seq_id} {description}"
+    else:
+        title = seq_id
+    
+    data = bytes(record.seq)
+    lines = [data[i:i + _FASTA_LINE_WIDTH] for i in range(0, len(data), _FASTA_LINE_WIDTH)]
+    return b">" + title.encode() + b"\n" + b"\n".join(lines) + b"\n"
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write a whole buffer to path with raw os calls, bypassing Python file objects."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _make_record(title: str, seq: str) -> SeqRecord:
+    """Build a SeqRecord with the id/name/description SeqIO would assign."""
+    seq_id = title.split(None, 1)[0] if title else ''
+    return SeqRecord(Seq(seq), id=seq_id, name=seq_id, description=title)
+
 
 class FileHandler:
     """Handles file operations for sequences and results."""
@@ -15,28 +153,23 @@ class FileHandler:
     def __init__(self, config):
         """Initialize with configuration."""
         self.config = config
+        self._remote_base = Path(config.remote.remote_data_dir)
     
     def load_sequence(self, file_path: Union[str, Path]) -> SeqRecord:
         """Load a sequence from file."""
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Sequence file not found: {file_path}")
-        
         # Try to determine format from extension
-        format_map = {
-            '.fasta': 'fasta',
-            '.fa': 'fasta',
-            '.fastq': 'fastq',
-            '.fq': 'fastq',
-            '.txt': 'fasta'  # Assume FASTA for .txt files
-        }
-        
-        file_format = format_map.get(file_path.suffix.lower(), 'fasta')
+        file_format = _FORMAT_MAP.get(file_path.suffix.lower(), 'fasta')
         
         try:
-            record = next(SeqIO.parse(file_path, file_format))
-            return record
+            records = _iter_fast(file_path, file_format)
+            try:
+                return next(records)
+            finally:
+                records.close()
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to parse sequence file {file_path}: {e}")
     
@@ -45,52 +178,91 @@ class FileHandler:
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
+        if (format == 'fasta' and isinstance(sequence, SeqRecord)
+                and len(sequence.seq) >= _BULK_WRITE_THRESHOLD):
+            file_path.write_bytes(_format_fasta(sequence))
+            return
+        
         SeqIO.write(sequence, file_path, format)
     
     def load_sequences(self, file_path: Union[str, Path]) -> List[SeqRecord]:
         """Load multiple sequences from file."""
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Sequence file not found: {file_path}")
-        
-        format_map = {
-            '.fasta': 'fasta',
-            '.fa': 'fasta',
-            '.fastq': 'fastq',
-            '.fq': 'fastq',
-            '.txt': 'fasta'
-        }
-        
-        file_format = format_map.get(file_path.suffix.lower(), 'fasta')
+        file_format = _FORMAT_MAP.get(file_path.suffix.lower(), 'fasta')
         
         try:
-            records = list(SeqIO.parse(file_path, file_format))
-            return records
+            return list(_iter_fast(file_path, file_format))
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to parse sequence file {file_path}: {e}")
     
+    def iter_sequence_ids(self, file_path: Union[str, Path]) -> Iterator[str]:
+        """Yield the record IDs in a sequence file without loading the sequences.
+        
+        For FASTA this is a single pass over the lines that never builds
+        sequence strings, for counting, de-duplication or indexing large inputs.
+        """
+        file_path = Path(file_path)
+        
+        if _FORMAT_MAP.get(file_path.suffix.lower(), 'fasta') == 'fastq':
+            # '@' can also open a quality line, so FASTQ needs the real parser
+            with _open_sequence_file(file_path) as handle:
+                for title, _, _ in FastqGeneralIterator(handle):
+                    yield title.split(None, 1)[0] if title else ''
+            return
+        
+        with _open_sequence_file(file_path) as handle:
+            first = handle.readline()
+            if first and first[0] != '>':
+                raise ValueError(_FASTA_LEADING_TEXT_ERROR)
+            for line in chain((first,), handle):
+                if line[:1] == '>':
+                    parts = line[1:].split(None, 1)
+                    yield parts[0] if parts else ''
+    
     def save_results(self, results: Dict, file_path: Union[str, Path], format: str = 'json'):
         """Save results to file."""
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == 'json':
-            with open(file_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            file_path.write_bytes(dumps_json(results))
         else:
             raise ValueError(f"Unsupported format: {format}")
     
+    def save_results_many(self, results_by_name: Dict[str, Dict], out_dir: Union[str, Path],
+                          max_workers: Optional[int] = None) -> Dict[str, Path]:
+        """Save several results dicts as ``<name>.json`` files in one directory.
+        
+        All payloads are encoded up front, then written from a thread pool
+        with raw ``os.write`` calls, so many small files can be in flight at
+        once on parallel or networked storage.
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        
+        payloads = {name: dumps_json(results) for name, results in results_by_name.items()}
+        
+        paths = {name: out_dir / f"{name}.json" for name in payloads}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() surfaces the first write error, if any
+            list(executor.map(_write_bytes, paths.values(), payloads.values()))
+        
+        return paths
+    
     def load_results(self, file_path: Union[str, Path], format: str = 'json') -> Dict:
         """Load results from file."""
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"Results file not found: {file_path}")
-        
         if format.lower() == 'json':
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            try:
+                data = file_path.read_bytes()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Results file not found: {file_path}") from None
+            
+            return loads_json(data)
         else:
             raise ValueError(f"Unsupported format: {format}")
     
@@ -100,28 +272,25 @@ class FileHandler:
             base_dir = self.config.get_output_dir(remote=remote)
         
         base_dir = Path(base_dir)
-        dirs = [
-            base_dir,
-            base_dir / "structures",
-            base_dir / "plots",
-            base_dir / "statistics",
-            base_dir / "temp"
-        ]
+        base_dir.mkdir(parents=True, exist_ok=True)
         
-        for dir_path in dirs:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # The parents exist now, so each subdirectory is a single mkdir call
+        for name in ("structures", "plots", "statistics", "temp"):
+            try:
+                os.mkdir(base_dir / name)
+            except FileExistsError:
+                pass
         
         return base_dir
     
     def get_remote_path(self, local_path: Union[str, Path]) -> Path:
         """Convert local path to remote path."""
         local_path = Path(local_path)
-        remote_base = Path(self.config.remote.remote_data_dir)
         
         # If it's already a relative path, just prepend remote base
         if not local_path.is_absolute():
-            return remote_base / local_path
+            return self._remote_base / local_path
         
         # For absolute paths, we need to determine the relative part
         # This is a simplified approach - you might want to customize this
-        return remote_base / local_path.name
+        return self._remote_base / local_path.name
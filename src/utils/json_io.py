@@ -0,0 +1,40 @@
+"""JSON encoding shared by the predictors, file handlers and pipeline scripts."""
+
+import json
+from typing import Any, Union
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; results fall back to the stdlib json module
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj):
+    """Serialise NumPy values (e.g. base-pair arrays); anything else becomes a string."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode results as indented JSON bytes.
+
+    NumPy arrays and scalars are written as plain JSON values, non-string
+    keys are stringified and any other unknown object becomes its ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, indent=2, default=_json_default).encode()
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
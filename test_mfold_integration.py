@@ -5,6 +5,7 @@ Test script to compare RNAfold and Mfold predictions on the same sequence.
 
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import os
 
@@ -14,21 +15,19 @@ def test_rnafold(sequence, output_dir):
     
     # Create input file
     input_file = output_dir / "test_sequence.fasta"
-    with open(input_file, 'w') as f:
-        f.write(f">test_sequence\n{sequence}\n")
+    with open(input_file, 'wb') as f:
+        f.write(b">test_sequence\n" + sequence.encode('ascii') + b"\n")
     
-    # Run RNAfold
+    # Run RNAfold, streaming its stdout straight into the output file
+    output_file = output_dir / "rnafold_output.txt"
     try:
-        result = subprocess.run(['RNAfold', str(input_file)], 
-                              capture_output=True, text=True, check=True,
-                              cwd=output_dir)
+        with open(output_file, 'wb') as out:
+            subprocess.run(['RNAfold', str(input_file)], 
+                           stdout=out, stderr=subprocess.PIPE, text=True, check=True,
+                           cwd=output_dir)
         
         print("✓ RNAfold completed successfully")
-        print(f"Output: {result.stdout}")
-        
-        # Save output
-        with open(output_dir / "rnafold_output.txt", 'w') as f:
-            f.write(result.stdout)
+        print(f"Output: {output_file} ({output_file.stat().st_size} bytes)")
         
         return True
     except subprocess.CalledProcessError as e:
@@ -42,8 +41,8 @@ def test_mfold(sequence, output_dir):
     
     # Create input file
     input_file = output_dir / "test_sequence.fasta"
-    with open(input_file, 'w') as f:
-        f.write(f">test_sequence\n{sequence}\n")
+    with open(input_file, 'wb') as f:
+        f.write(b">test_sequence\n" + sequence.encode('ascii') + b"\n")
     
     # Set environment variables for mfold
     env = os.environ.copy()
@@ -51,22 +50,22 @@ def test_mfold(sequence, output_dir):
     env['T'] = '37.0'
     env['MAX'] = '10'
     
+    # Stream Mfold's stdout straight into the output file
+    output_file = output_dir / "mfold_output.txt"
     try:
-        result = subprocess.run(['mfold'], 
-                              capture_output=True, text=True, check=True,
-                              cwd=output_dir, env=env)
+        with open(output_file, 'wb') as out:
+            subprocess.run(['mfold'], 
+                           stdout=out, stderr=subprocess.PIPE, text=True, check=True,
+                           cwd=output_dir, env=env)
         
         print("✓ Mfold completed successfully")
-        print(f"Output: {result.stdout}")
-        
-        # Save output
-        with open(output_dir / "mfold_output.txt", 'w') as f:
-            f.write(result.stdout)
+        print(f"Output: {output_file} ({output_file.stat().st_size} bytes)")
         
         # List created files
         print("Files created by Mfold:")
-        for file in output_dir.glob("*"):
-            print(f"  {file.name}")
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                print(f"  {entry.name}")
         
         return True
     except subprocess.CalledProcessError as e:
@@ -88,13 +87,19 @@ def main():
         temp_path = Path(temp_dir)
         print(f"Using temporary directory: {temp_path}")
         
-        # Test RNAfold
-        print("\n" + "=" * 30)
-        rnafold_success = test_rnafold(test_sequence, temp_path)
-        
-        # Test Mfold
+        # The tools are independent, so run them side by side; each gets its
+        # own directory because both write test_sequence.fasta
         print("\n" + "=" * 30)
-        mfold_success = test_mfold(test_sequence, temp_path)
+        tests = {'rnafold': test_rnafold, 'mfold': test_mfold}
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {}
+            for name, test in tests.items():
+                tool_dir = temp_path / name
+                tool_dir.mkdir()
+                futures[executor.submit(test, test_sequence, tool_dir)] = name
+            outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+        rnafold_success = outcomes['rnafold']
+        mfold_success = outcomes['mfold']
         
         # Summary
         print("\n" + "=" * 60)
@@ -15,6 +15,30 @@ sys.path.append(str(Path(__file__).parent / "scripts"))
 
 from mrna_structure_pipeline import mRNAStructurePipeline
 from mrna_visualization_pipeline import mRNAVisualizationPipeline
+from json_io import dumps_json
+
+
+# Mock comparison results using Tetrahymena data, serialised once at import
+_MOCK_RESULTS = {
+    "sequence_name": "TETRAHYMENA_5UTR",
+    "sequence": "GGCAGGAAACCGGUGAGUAGCGCAGGGUUCGGUGUAGUCCGUGAGGCGAAAGCGCUAGCCGAAAGGCGAAACCGCUGAUGAGUAGCGCAGGGUUCGAUCCGGUAGCGAAAGCGCUAGCCGAAAGGCGAAACCGCU",
+    "sequence_length": 135,
+    "methods_tested": ["rnafold_default"],
+    "results": {
+        "rnafold_default": {
+            "method": "rnafold",
+            "parameters": "default",
+            "sequence": "GGCAGGAAACCGGUGAGUAGCGCAGGGUUCGGUGUAGUCCGUGAGGCGAAAGCGCUAGCCGAAAGGCGAAACCGCUGAUGAGUAGCGCAGGGUUCGAUCCGGUAGCGAAAGCGCUAGCCGAAAGGCGAAACCGCU",
+            "structure": "((((...((((((....((((.((....(((.((..((((.((((((..((...((((....))))..))..))))))....)))).))))))).)))).))))))))))...((((....))))",
+            "energy": -42.9,
+            "base_pairs": [(0, 134), (1, 133), (2, 132), (3, 131), (4, 130)],
+            "num_base_pairs": 41,
+            "gc_content": 0.607,
+            "base_pair_density": 0.328
+        }
+    }
+}
+_MOCK_BYTES = dumps_json(_MOCK_RESULTS)
 
 
 def check_remote_environment():
@@ -73,34 +97,11 @@ def test_visualization_pipeline():
         return True
     
     try:
-        # Create mock results in remote directory using Tetrahymena data
-        mock_results = {
-            "sequence_name": "TETRAHYMENA_5UTR",
-            "sequence": "GGCAGGAAACCGGUGAGUAGCGCAGGGUUCGGUGUAGUCCGUGAGGCGAAAGCGCUAGCCGAAAGGCGAAACCGCUGAUGAGUAGCGCAGGGUUCGAUCCGGUAGCGAAAGCGCUAGCCGAAAGGCGAAACCGCU",
-            "sequence_length": 135,
-            "methods_tested": ["rnafold_default"],
-            "results": {
-                "rnafold_default": {
-                    "method": "rnafold",
-                    "parameters": "default",
-                    "sequence": "GGCAGGAAACCGGUGAGUAGCGCAGGGUUCGGUGUAGUCCGUGAGGCGAAAGCGCUAGCCGAAAGGCGAAACCGCUGAUGAGUAGCGCAGGGUUCGAUCCGGUAGCGAAAGCGCUAGCCGAAAGGCGAAACCGCU",
-                    "structure": "((((...((((((....((((.((....(((.((..((((.((((((..((...((((....))))..))..))))))....)))).))))))).)))).))))))))))...((((....))))",
-                    "energy": -42.9,
-                    "base_pairs": [(0, 134), (1, 133), (2, 132), (3, 131), (4, 130)],
-                    "num_base_pairs": 41,
-                    "gc_content": 0.607,
-                    "base_pair_density": 0.328
-                }
-            }
-        }
-        
-        # Save mock results in remote directory
         results_dir = Path("/orcd/data/mbathe/001/rcm095/RNA_predictions/output/comparisons")
         results_dir.mkdir(parents=True, exist_ok=True)
         
-        import json
-        with open(results_dir / "TETRAHYMENA_comprehensive_results.json", 'w') as f:
-            json.dump(mock_results, f)
+        # Save mock results in remote directory
+        (results_dir / "TETRAHYMENA_comprehensive_results.json").write_bytes(_MOCK_BYTES)
         
         # Initialize visualization pipeline
         viz_pipeline = mRNAVisualizationPipeline("TETRAHYMENA", str(results_dir))